@@ -5,8 +5,9 @@ Finds articles without featured_image and generates + uploads them.
 
 import os
 import sys
-import time
+import threading
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -17,12 +18,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-from scripts.database import DatabaseClient
-from scripts.fetch_images import generate_gemini_image
+from scripts.database import get_db_client
+from scripts.fetch_images import generate_gemini_image_cached, IMAGE_WORKERS
+
+# Completed images written to the DB per bulk upsert
+BATCH_SIZE = 50
 
 
 def main():
-    db = DatabaseClient()
+    db = get_db_client()
 
     # Find articles without images
     articles = db.list_articles_without_images()
@@ -34,37 +38,56 @@ def main():
 
     success = 0
     failed = 0
-
-    for i, article in enumerate(articles):
-        title = article.get('title', '')[:60]
-        slug = article.get('slug', '')
-        logger.info(f"\n[{i+1}/{len(articles)}] {title}...")
-
-        # Generate image with Gemini
-        image_url = generate_gemini_image(article)
-
-        if image_url:
-            # Update article in DB
-            result = db.update_article(slug, {
-                'featured_image': image_url,
-                'image_attribution': {
-                    'source': 'gemini',
-                    'model': 'gemini-2.5-flash-image',
-                },
-            })
-            if result:
-                success += 1
-                logger.info(f"  -> Updated: {image_url}")
+    pending = []
+    lock = threading.Lock()
+
+    def generate(article):
+        logger.info(f"Generating: {article.get('title', '')[:60]}...")
+        return generate_gemini_image_cached(article, db)
+
+    def flush():
+        nonlocal success, failed
+        if not pending:
+            return
+        written = db.update_article_images(pending)
+        with lock:
+            success += written
+            failed += len(pending) - written
+        if written < len(pending):
+            logger.error(f"  -> DB update failed for {len(pending) - written} article(s)")
+        pending.clear()
+
+    with ThreadPoolExecutor(max_workers=IMAGE_WORKERS) as executor:
+        futures = {executor.submit(generate, a): a for a in articles}
+
+        for done, future in enumerate(as_completed(futures), 1):
+            article = futures[future]
+            logger.info(f"\n[{done}/{len(articles)}] {article.get('title', '')[:60]}...")
+
+            try:
+                image_url = future.result()
+            except Exception as e:
+                logger.error(f"  -> Image generation raised: {e}")
+                image_url = None
+
+            if image_url:
+                pending.append({
+                    'slug': article['slug'],
+                    'featured_image': image_url,
+                    'image_attribution': {
+                        'source': 'gemini',
+                        'model': 'gemini-2.5-flash-image',
+                    },
+                })
+                logger.info(f"  -> Generated: {image_url}")
+                if len(pending) >= BATCH_SIZE:
+                    flush()
             else:
-                failed += 1
-                logger.error(f"  -> DB update failed for {slug}")
-        else:
-            failed += 1
-            logger.warning(f"  -> Image generation failed")
-
-        # Rate limit: wait between requests
-        if i < len(articles) - 1:
-            time.sleep(3)
+                with lock:
+                    failed += 1
+                logger.warning(f"  -> Image generation failed")
+
+    flush()
 
     logger.info(f"\nBackfill complete: {success} updated, {failed} failed out of {len(articles)} articles")
 
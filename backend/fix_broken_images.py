@@ -1,7 +1,7 @@
 """Fix articles with broken featured_image values (like '$undefined')."""
 
 import os
-import time
+import re
 import logging
 
 from dotenv import load_dotenv
@@ -13,24 +13,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-from scripts.database import DatabaseClient
-from scripts.fetch_images import generate_gemini_image
+from scripts.database import get_db_client
+from scripts.fetch_images import generate_gemini_image_cached
+
+# Broken values left behind by the frontend/serializer ('$undefined', 'undefined', ...)
+_BROKEN_RE = re.compile(r'undefined', re.I)
 
 
 def main():
-    db = DatabaseClient()
+    db = get_db_client()
 
-    # Find ALL published articles and check for broken images
+    # Find published articles with missing or broken images (filtered server-side)
     result = db.client.table('articles') \
         .select('slug, title, topic, meta_description, featured_image') \
         .eq('published', True) \
+        .or_('featured_image.is.null,featured_image.eq.,featured_image.ilike.*undefined*') \
         .execute()
 
-    broken = []
-    for a in result.data:
-        img = a.get('featured_image', '')
-        if not img or img == '$undefined' or img == 'undefined' or 'undefined' in str(img):
-            broken.append(a)
+    # Re-check client-side as a fallback in case the server filter is bypassed
+    broken = [
+        a for a in result.data or []
+        if not a.get('featured_image') or _BROKEN_RE.search(a['featured_image'])
+    ]
 
     if not broken:
         logger.info("No broken images found!")
@@ -40,31 +44,33 @@ def main():
     for a in broken:
         logger.info(f"  - {a['slug']} (image: {a.get('featured_image', 'null')})")
 
-    success = 0
+    fixed = []
+    cleared = []
     for i, article in enumerate(broken):
         slug = article['slug']
         logger.info(f"\n[{i+1}/{len(broken)}] {article['title'][:60]}...")
 
-        image_url = generate_gemini_image(article)
+        image_url = generate_gemini_image_cached(article, db)
         if image_url:
-            db.update_article(slug, {
+            fixed.append({
+                'slug': slug,
                 'featured_image': image_url,
                 'image_attribution': {
                     'source': 'gemini',
                     'model': 'gemini-2.5-flash-image',
                 },
             })
-            success += 1
             logger.info(f"  -> Fixed: {image_url}")
         else:
             # Clear the broken value so frontend shows category thumbnail
-            db.update_article(slug, {'featured_image': None})
-            logger.info(f"  -> Cleared broken value, will show category thumbnail")
+            cleared.append(slug)
+            logger.info(f"  -> Broken value will be cleared, frontend will show category thumbnail")
 
-        if i < len(broken) - 1:
-            time.sleep(3)
+    # Write all results in two round-trips instead of one PATCH per article
+    success = db.update_article_images(fixed)
+    db.update_articles_by_slugs(cleared, {'featured_image': None})
 
-    logger.info(f"\nDone: {success} images generated, {len(broken) - success} cleared")
+    logger.info(f"\nDone: {success} images generated, {len(cleared)} cleared")
 
 
 if __name__ == '__main__':
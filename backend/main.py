@@ -10,21 +10,29 @@ Orchestrates the complete workflow:
 """
 
 import argparse
+import atexit
+import copy
+import functools
+import itertools
 import logging
+import os
+import queue
 import sys
 import yaml
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional
 
 from dotenv import load_dotenv
 
 from scripts.fetch_trending import get_all_trending_topics
-from scripts.generate_content import generate_multiple_articles
+from scripts.generate_content import iter_generated_articles, GEMINI_CLI_PATH
 from scripts.optimize_adsense import optimize_ad_placement, validate_adsense_config
 from scripts.save_article import save_multiple_articles
-from scripts.fetch_images import fetch_images_for_articles
-from scripts.reclassify import classify_articles
+from scripts.fetch_images import fetch_image_for_article, genai_new, IMAGE_WORKERS
+from scripts.reclassify import verify_article_category
 
 # Import database utilities
 try:
@@ -37,15 +45,33 @@ except ImportError:
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(f'automation_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'),
-        logging.StreamHandler(sys.stdout)
+
+def configure_logging() -> None:
+    """
+    Route log records through a queue so disk/console I/O happens on the
+    listener thread, not on the pipeline's worker threads.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.FileHandler(f'automation_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log', encoding='utf-8'),
+        logging.StreamHandler(sys.stdout),
     ]
-)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # force=True: imported script modules already called basicConfig
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[QueueHandler(log_queue)],
+        force=True
+    )
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,13 +80,10 @@ def validate_environment() -> None:
     Validate environment variables and database connection.
     Checks for required API keys and Supabase configuration.
     """
-    import os
-
     logger.info("\nValidating environment...")
 
-    # Check Gemini CLI availability
-    import shutil
-    if shutil.which('gemini'):
+    # Check Gemini CLI availability (probed once at import by generate_content)
+    if GEMINI_CLI_PATH:
         logger.info("✓ Gemini CLI found")
     elif os.getenv('GOOGLE_API_KEY'):
         logger.info("✓ Google API key found (Gemini CLI not available, using API)")
@@ -99,13 +122,8 @@ def validate_environment() -> None:
     else:
         logger.info("⊘ Supabase not enabled, using JSON-only mode")
 
-    # Check Gemini image generation capability
-    _can_generate_images = os.getenv('GOOGLE_API_KEY') is not None
-    try:
-        from google import genai as _genai_check
-        _can_generate_images = _can_generate_images and True
-    except ImportError:
-        _can_generate_images = False
+    # Check Gemini image generation capability (SDK already imported by fetch_images)
+    _can_generate_images = os.getenv('GOOGLE_API_KEY') is not None and genai_new is not None
 
     if _can_generate_images:
         logger.info("✓ Gemini image generation available (google-genai + API key)")
@@ -121,6 +139,19 @@ def validate_environment() -> None:
     logger.info("Environment validation complete\n")
 
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_config(config_path: str, mtime: float) -> Dict:
+    """Parse a config file; cached per (path, mtime) so edits are picked up."""
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
 def load_config(config_path: str = 'config.yaml') -> Dict:
     """
     Load configuration from YAML file.
@@ -132,10 +163,10 @@ def load_config(config_path: str = 'config.yaml') -> Dict:
         Configuration dictionary
     """
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-            logger.info(f"Configuration loaded from {config_path}")
-            return config
+        config = _parse_config(config_path, os.path.getmtime(config_path))
+        logger.info(f"Configuration loaded from {config_path}")
+        # Callers mutate the config (e.g. --markets), so never hand out the cached copy
+        return copy.deepcopy(config)
     except FileNotFoundError:
         logger.error(f"Config file not found: {config_path}")
         sys.exit(1)
@@ -144,8 +175,110 @@ def load_config(config_path: str = 'config.yaml') -> Dict:
         sys.exit(1)
 
 
-def main():
-    """Main execution function."""
+def _prepare_article(article: Dict, fetch_images: bool) -> Dict:
+    """STEP 2.5 + 2.6 for one article: verify its category, then fetch a cover image."""
+    try:
+        verify_article_category(article)
+    except Exception as e:
+        logger.warning(f"Category verification failed for '{article['title']}': {e}")
+        logger.warning("Continuing with original category...")
+
+    if fetch_images and not article.get('featured_image'):
+        try:
+            fetch_image_for_article(article)
+        except Exception as e:
+            logger.warning(f"Error fetching image for '{article['title']}': {e}")
+            logger.warning("Continuing without cover image...")
+
+    return article
+
+
+def process_articles(
+    articles: Iterable[Dict],
+    fetch_images: bool = True,
+    adsense_config: Optional[Dict] = None
+) -> Iterator[Dict]:
+    """
+    Run STEPs 2.5 / 2.6 / 3 as a per-article pipeline.
+
+    Category verification and image fetching run on a thread pool, starting
+    as soon as each article arrives from the (possibly lazy) input. When an
+    article clears them, its AdSense optimization (HTML parsing) is handed to
+    a second thread pool, so no stage waits for the whole batch. Threads
+    rather than processes: the pool is created mid-run, when forking would
+    copy held locks and drop logging queued for the QueueListener.
+
+    Args:
+        articles: Generated articles (updated in place), e.g. a generator
+        fetch_images: Whether to fetch cover images
+        adsense_config: AdSense config, or None to skip ad insertion
+
+    Yields:
+        Each article once all of its stages have finished, in completion order
+    """
+    ad_pool = None
+    prepare_futures = set()
+    ad_futures = {}
+
+    def _optimize(article: Dict) -> Iterator[Dict]:
+        """Queue AdSense optimization, or yield right away if there's nothing to do."""
+        nonlocal ad_pool
+        if not adsense_config:
+            yield article
+            return
+
+        logger.info(f"Optimizing AdSense placement: {article['title']}")
+        if ad_pool is None and not ad_futures and not prepare_futures:
+            # Lone article: not worth starting a pool
+            article['content'] = optimize_ad_placement(article['content'], adsense_config)
+            yield article
+            return
+
+        if ad_pool is None:
+            ad_pool = ThreadPoolExecutor()
+        ad_futures[ad_pool.submit(optimize_ad_placement, article['content'], adsense_config)] = article
+
+    def _finish(future) -> Dict:
+        article = ad_futures.pop(future)
+        try:
+            article['content'] = future.result()
+        except Exception as e:
+            logger.error(f"Error optimizing AdSense for '{article['title']}': {e}")
+        return article
+
+    def _drain_done() -> Iterator[Dict]:
+        """Yield articles whose stages finished, without blocking."""
+        for future in [f for f in prepare_futures if f.done()]:
+            prepare_futures.discard(future)
+            yield from _optimize(future.result())
+        for future in [f for f in ad_futures if f.done()]:
+            yield _finish(future)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, IMAGE_WORKERS)) as executor:
+            for article in articles:
+                prepare_futures.add(executor.submit(_prepare_article, article, fetch_images))
+                yield from _drain_done()
+
+            for future in as_completed(list(prepare_futures)):
+                prepare_futures.discard(future)
+                yield from _optimize(future.result())
+
+        for future in as_completed(list(ad_futures)):
+            yield _finish(future)
+    finally:
+        if ad_pool:
+            ad_pool.shutdown()
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Main execution function.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:]); lets the
+              scheduler run the pipeline in-process
+    """
     parser = argparse.ArgumentParser(
         description='AdSense Blog Automation System with Next.js',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -201,7 +334,7 @@ Examples:
         help='Output directory for articles (default: ../frontend/public/articles)'
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     logger.info("=" * 80)
     logger.info("AdSense Blog Automation System (Next.js)")
@@ -239,110 +372,59 @@ Examples:
             sys.exit(1)
 
         logger.info(f"\nTop 10 trending topics:")
-        for i, topic in enumerate(topics[:10], 1):
+        for i, topic in enumerate(itertools.islice(topics, 10), 1):
             logger.info(f"  {i}. {topic['keyword'][:60]}... (Source: {topic['source']}, Score: {topic['score']})")
 
     except Exception as e:
         logger.error(f"Error fetching trending topics: {e}")
         sys.exit(1)
 
-    # STEP 2: Generate Articles
+    # STEPs 2-4 are streamed: each article is generated, classified, imaged,
+    # optimized and saved without waiting for the rest of the batch
     logger.info("\n" + "=" * 80)
     logger.info("STEP 2: Generating Articles with Gemini")
-    logger.info("=" * 80)
-
-    try:
-        articles = generate_multiple_articles(
-            topics=topics,
-            articles_count=args.articles,
-            min_words=config['automation'].get('min_words', 1500),
-            max_words=config['automation'].get('max_words', 2000)
-        )
-
-        if not articles:
-            logger.error("No articles generated. Exiting.")
-            sys.exit(1)
-
-        logger.info(f"\nSuccessfully generated {len(articles)} articles:")
-        for i, article in enumerate(articles, 1):
-            logger.info(f"  {i}. {article['title']} ({article['word_count']} words)")
-
-    except Exception as e:
-        logger.error(f"Error generating articles: {e}")
-        sys.exit(1)
-
-    # STEP 2.5: Verify & Correct Categories
-    logger.info("\n" + "=" * 80)
-    logger.info("STEP 2.5: Verifying Article Categories with Gemini")
-    logger.info("=" * 80)
-
-    try:
-        articles = classify_articles(articles)
-        logger.info("✓ Category verification complete")
-    except Exception as e:
-        logger.warning(f"Category verification failed: {e}")
-        logger.warning("Continuing with original categories...")
-
-    # STEP 2.6: Fetch Unsplash Cover Images
-    if not args.no_images:
-        logger.info("\n" + "=" * 80)
-        logger.info("STEP 2.6: Generating Cover Images (Gemini AI + Unsplash fallback)")
-        logger.info("=" * 80)
-
-        try:
-            articles = fetch_images_for_articles(articles)
-            images_found = sum(1 for a in articles if a.get('featured_image'))
-            logger.info(f"✓ Images fetched: {images_found}/{len(articles)} articles have cover images")
-        except Exception as e:
-            logger.warning(f"Error fetching images: {e}")
-            logger.warning("Continuing without cover images...")
-    else:
-        logger.info("\n⊘ Skipping image generation (--no-images flag)")
-
-    # STEP 3: Optimize with AdSense
-    if not args.no_adsense:
-        logger.info("\n" + "=" * 80)
-        logger.info("STEP 3: Optimizing AdSense Placement")
-        logger.info("=" * 80)
-
-        try:
-            adsense_config = config.get('adsense', {})
-
-            if validate_adsense_config(adsense_config):
-                for i, article in enumerate(articles, 1):
-                    logger.info(f"Optimizing article {i}/{len(articles)}: {article['title']}")
-
-                    optimized_content = optimize_ad_placement(
-                        article['content'],
-                        adsense_config
-                    )
-
-                    article['content'] = optimized_content
-
-                logger.info(f"✓ All articles optimized with AdSense ads")
-            else:
-                logger.warning("Invalid AdSense config. Skipping ad insertion.")
-
-        except Exception as e:
-            logger.error(f"Error optimizing AdSense: {e}")
-            logger.warning("Continuing without ad optimization...")
-    else:
-        logger.info("\n⊘ Skipping AdSense optimization (--no-adsense flag)")
-
-    # STEP 4: Save Articles
-    logger.info("\n" + "=" * 80)
+    logger.info("STEP 2.5-3: Verifying Categories, Generating Cover Images, Optimizing AdSense")
     if SUPABASE_AVAILABLE and is_supabase_enabled():
         logger.info("STEP 4: Saving Articles to Database and JSON")
     else:
         logger.info("STEP 4: Saving Articles to JSON")
     logger.info("=" * 80)
 
+    if args.no_images:
+        logger.info("⊘ Skipping image generation (--no-images flag)")
+
+    adsense_config = None
+    if args.no_adsense:
+        logger.info("⊘ Skipping AdSense optimization (--no-adsense flag)")
+    elif validate_adsense_config(config.get('adsense', {})):
+        adsense_config = config.get('adsense', {})
+    else:
+        logger.warning("Invalid AdSense config. Skipping ad insertion.")
+
     try:
+        generated = iter_generated_articles(
+            topics=topics,
+            articles_count=args.articles,
+            min_words=config['automation'].get('min_words', 1500),
+            max_words=config['automation'].get('max_words', 2000),
+            concurrency=config['automation'].get('generation_concurrency', 4)
+        )
+        # Both stages are lazy: each article's category check and image fetch
+        # start while later articles in the batch are still being generated
+        processed = process_articles(
+            generated,
+            fetch_images=not args.no_images,
+            adsense_config=adsense_config
+        )
         results = save_multiple_articles(
-            articles=articles,
+            articles=processed,
             output_dir=args.output
         )
 
+        if not results:
+            logger.error("No articles generated. Exiting.")
+            sys.exit(1)
+
         # Print summary
         logger.info("\n" + "=" * 80)
         logger.info("SAVE SUMMARY")
@@ -362,7 +444,7 @@ Examples:
             logger.info(f"     Path: {path}")
 
     except Exception as e:
-        logger.error(f"Error saving articles: {e}")
+        logger.error(f"Error generating or saving articles: {e}")
         sys.exit(1)
 
     # Final Summary
@@ -382,6 +464,7 @@ Examples:
 
 
 if __name__ == "__main__":
+    configure_logging()
     try:
         main()
     except KeyboardInterrupt:
@@ -5,16 +5,19 @@ Scheduled Article Publisher
 Automatically generates and publishes articles at scheduled intervals.
 """
 
-import schedule
 import time
-import subprocess
+import threading
 import logging
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# Configure logging
+# Imported once so the dependency stack, HTTP sessions and DB client are
+# reused across runs instead of paid for by a fresh interpreter each hour
+from main import main as run_main
+
+# Configure logging (force=True: imported modules already called basicConfig)
 log_file = f'scheduled_publisher_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
 logging.basicConfig(
     level=logging.INFO,
@@ -22,10 +25,15 @@ logging.basicConfig(
     handlers=[
         logging.FileHandler(log_file),
         logging.StreamHandler()
-    ]
+    ],
+    force=True
 )
 logger = logging.getLogger(__name__)
 
+GENERATION_TIMEOUT = 600  # 10 minutes
+_BANNER = "=" * 80
+_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
 
 class ScheduledPublisher:
     def __init__(self, total_hours=15, articles_per_run=1):
@@ -43,6 +51,7 @@ class ScheduledPublisher:
         self.articles_generated = 0
         self.successful_runs = 0
         self.failed_runs = 0
+        self._worker = None
 
     def should_continue(self):
         """Check if we should continue running."""
@@ -52,62 +61,78 @@ class ScheduledPublisher:
             return False
         return True
 
+    def _run_generation(self, outcome: dict):
+        """Run the main pipeline in-process and record its exit code."""
+        try:
+            run_main(['--articles', str(self.articles_per_run), '--no-adsense'])
+            outcome['code'] = 0
+        except SystemExit as e:
+            outcome['code'] = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception as e:
+            outcome['code'] = 1
+            outcome['error'] = str(e)
+
     def generate_article(self):
         """Generate and publish one article."""
         if not self.should_continue():
-            return schedule.CancelJob
-
-        logger.info("=" * 80)
-        logger.info(f"Starting scheduled article generation #{self.successful_runs + 1}")
-        logger.info(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.info(f"Articles generated so far: {self.articles_generated}")
-        logger.info("=" * 80)
-
-        try:
-            # Run main.py to generate article
-            result = subprocess.run(
-                ['python3', 'main.py', '--articles', str(self.articles_per_run), '--no-adsense'],
-                capture_output=True,
-                text=True,
-                timeout=600  # 10 minute timeout
-            )
-
-            if result.returncode == 0:
+            return
+
+        # Multi-line blocks are logged as one record each (one write per block)
+        logger.info("\n".join([
+            _BANNER,
+            f"Starting scheduled article generation #{self.successful_runs + 1}",
+            f"Time: {datetime.now().strftime(_TIME_FORMAT)}",
+            f"Articles generated so far: {self.articles_generated}",
+            _BANNER,
+        ]))
+
+        if self._worker is not None and self._worker.is_alive():
+            # A timed-out run can't be killed in-process; don't stack another on it
+            self.failed_runs += 1
+            logger.error("✗ Previous generation still running, skipping this run")
+        else:
+            outcome = {}
+            self._worker = threading.Thread(target=self._run_generation, args=(outcome,), daemon=True)
+            self._worker.start()
+            self._worker.join(GENERATION_TIMEOUT)
+
+            if self._worker.is_alive():
+                self.failed_runs += 1
+                logger.error("✗ Article generation timed out (10 minutes)")
+            elif outcome.get('code') == 0:
                 self.successful_runs += 1
                 self.articles_generated += self.articles_per_run
                 logger.info(f"✓ Successfully generated {self.articles_per_run} article(s)")
                 logger.info(f"Total articles: {self.articles_generated}/{self.total_hours}")
+            elif 'error' in outcome:
+                self.failed_runs += 1
+                logger.error(f"✗ Error generating article: {outcome['error']}")
             else:
                 self.failed_runs += 1
-                logger.error(f"✗ Failed to generate article. Exit code: {result.returncode}")
-                logger.error(f"Error output: {result.stderr[:500]}")
-
-        except subprocess.TimeoutExpired:
-            self.failed_runs += 1
-            logger.error("✗ Article generation timed out (10 minutes)")
-        except Exception as e:
-            self.failed_runs += 1
-            logger.error(f"✗ Error generating article: {str(e)}")
+                logger.error(f"✗ Failed to generate article. Exit code: {outcome.get('code')}")
 
         # Print statistics
-        remaining_hours = (self.end_time - datetime.now()).total_seconds() / 3600
-        logger.info(f"\nStatistics:")
-        logger.info(f"  Successful: {self.successful_runs}")
-        logger.info(f"  Failed: {self.failed_runs}")
-        logger.info(f"  Total articles: {self.articles_generated}")
-        logger.info(f"  Time remaining: {remaining_hours:.1f} hours")
-        logger.info(f"  Next run: {(datetime.now() + timedelta(hours=1)).strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.info("=" * 80 + "\n")
-
-        # Check if we should cancel the job
-        if not self.should_continue():
-            logger.info("Scheduler finished. Final statistics:")
-            logger.info(f"  Total articles generated: {self.articles_generated}")
-            logger.info(f"  Successful runs: {self.successful_runs}")
-            logger.info(f"  Failed runs: {self.failed_runs}")
-            logger.info(f"  Duration: {total_hours} hours")
-            return schedule.CancelJob
+        now = datetime.now()
+        remaining_hours = (self.end_time - now).total_seconds() / 3600
+        next_run = self.start_time + timedelta(hours=int((now - self.start_time).total_seconds() // 3600) + 1)
+        logger.info("\n".join([
+            "\nStatistics:",
+            f"  Successful: {self.successful_runs}",
+            f"  Failed: {self.failed_runs}",
+            f"  Total articles: {self.articles_generated}",
+            f"  Time remaining: {remaining_hours:.1f} hours",
+            f"  Next run: {next_run.strftime(_TIME_FORMAT)}",
+            _BANNER + "\n",
+        ]))
 
+        if not self.should_continue():
+            logger.info("\n".join([
+                "Scheduler finished. Final statistics:",
+                f"  Total articles generated: {self.articles_generated}",
+                f"  Successful runs: {self.successful_runs}",
+                f"  Failed runs: {self.failed_runs}",
+                f"  Duration: {self.total_hours} hours",
+            ]))
 
 def main():
     """Main entry point."""
@@ -151,24 +176,24 @@ Examples:
 
     args = parser.parse_args()
 
-    logger.info("╔" + "═" * 78 + "╗")
-    logger.info("║" + " " * 20 + "SCHEDULED ARTICLE PUBLISHER" + " " * 31 + "║")
-    logger.info("╚" + "═" * 78 + "╝")
-    logger.info(f"\nConfiguration:")
-    logger.info(f"  Duration: {args.hours} hours")
-    logger.info(f"  Articles per hour: {args.articles}")
-    logger.info(f"  Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    logger.info(f"  End time: {(datetime.now() + timedelta(hours=args.hours)).strftime('%Y-%m-%d %H:%M:%S')}")
-    logger.info(f"  Log file: {log_file}")
-    logger.info(f"  Immediate start: {args.immediate}")
-    logger.info("")
+    now = datetime.now()
+    logger.info("\n".join([
+        "╔" + "═" * 78 + "╗",
+        "║" + " " * 20 + "SCHEDULED ARTICLE PUBLISHER" + " " * 31 + "║",
+        "╚" + "═" * 78 + "╝",
+        "\nConfiguration:",
+        f"  Duration: {args.hours} hours",
+        f"  Articles per hour: {args.articles}",
+        f"  Start time: {now.strftime(_TIME_FORMAT)}",
+        f"  End time: {(now + timedelta(hours=args.hours)).strftime(_TIME_FORMAT)}",
+        f"  Log file: {log_file}",
+        f"  Immediate start: {args.immediate}",
+        "",
+    ]))
 
     # Create publisher
     publisher = ScheduledPublisher(total_hours=args.hours, articles_per_run=args.articles)
 
-    # Schedule job to run every hour
-    schedule.every().hour.do(publisher.generate_article)
-
     # Run immediately if requested
     if args.immediate:
         logger.info("Running first article generation immediately...\n")
@@ -177,9 +202,22 @@ Examples:
     logger.info("Scheduler started. Press Ctrl+C to stop.\n")
 
     try:
+        # Sleep straight to each hourly slot instead of polling every minute.
+        # Slots are anchored to the start time, so a slow run doesn't drift
+        # the schedule; slots it overran are skipped.
+        run_number = 1
         while publisher.should_continue():
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+            elapsed_hours = (datetime.now() - publisher.start_time).total_seconds() / 3600
+            run_number = max(run_number, int(elapsed_hours) + 1)
+
+            next_run = publisher.start_time + timedelta(hours=run_number)
+            delay = (min(next_run, publisher.end_time) - datetime.now()).total_seconds()
+            if delay > 0:
+                time.sleep(delay)
+
+            if publisher.should_continue():
+                publisher.generate_article()
+            run_number += 1
 
         logger.info("\n✓ Scheduler completed successfully!")
 
@@ -8,15 +8,15 @@ Usage:
     python -m scripts.backfill_images
 """
 
-import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
 from scripts.database import get_db_client, is_supabase_enabled
-from scripts.fetch_images import _build_search_query, fetch_unsplash_image
+from scripts.fetch_images import _build_search_queries_batch, fetch_unsplash_image
 
 logging.basicConfig(
     level=logging.INFO,
@@ -24,6 +24,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Unsplash searches in flight at once
+UNSPLASH_WORKERS = 5
+
+# Found images written to the DB per bulk upsert
+BATCH_SIZE = 100
+
 
 def backfill_images() -> int:
     """
@@ -45,35 +51,43 @@ def backfill_images() -> int:
 
     logger.info(f"Found {len(articles)} articles without images")
     updated = 0
-
-    for i, article in enumerate(articles):
-        slug = article.get('slug', '')
-        title = article.get('title', '')
-        logger.info(f"[{i+1}/{len(articles)}] Processing: {title}")
-
-        query = _build_search_query(article)
-        logger.info(f"  Search query: '{query}'")
-
-        result = fetch_unsplash_image(query)
-
-        if result:
-            updates = {
-                'featured_image': result['url'],
-                'image_attribution': {
-                    'photographer_name': result['photographer_name'],
-                    'photographer_url': result['photographer_url'],
-                    'unsplash_url': result['unsplash_url'],
-                },
-            }
-            db.update_article(slug, updates)
-            logger.info(f"  -> Updated with image by {result['photographer_name']}")
-            updated += 1
-        else:
-            logger.warning(f"  -> No image found for: {title}")
-
-        # Rate limit: wait between requests (skip after last)
-        if i < len(articles) - 1:
-            time.sleep(1.5)
+    pending = []
+
+    def flush():
+        nonlocal updated
+        if pending:
+            updated += db.update_article_images(pending)
+            pending.clear()
+
+    # One Gemini prompt per batch of articles rather than one per article
+    queries = _build_search_queries_batch(articles)
+
+    with ThreadPoolExecutor(max_workers=UNSPLASH_WORKERS) as executor:
+        searches = executor.map(fetch_unsplash_image, queries)
+
+        for i, (article, query, result) in enumerate(zip(articles, queries, searches)):
+            slug = article.get('slug', '')
+            title = article.get('title', '')
+            logger.info(f"[{i+1}/{len(articles)}] Processing: {title}")
+            logger.info(f"  Search query: '{query}'")
+
+            if result:
+                pending.append({
+                    'slug': slug,
+                    'featured_image': result['url'],
+                    'image_attribution': {
+                        'photographer_name': result['photographer_name'],
+                        'photographer_url': result['photographer_url'],
+                        'unsplash_url': result['unsplash_url'],
+                    },
+                })
+                logger.info(f"  -> Found image by {result['photographer_name']}")
+                if len(pending) >= BATCH_SIZE:
+                    flush()
+            else:
+                logger.warning(f"  -> No image found for: {title}")
+
+    flush()
 
     logger.info(f"Backfill complete: {updated}/{len(articles)} articles updated")
     return updated
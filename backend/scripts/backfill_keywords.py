@@ -4,28 +4,44 @@ Backfill keywords for existing articles by re-extracting from content.
 Removes stop words and generates meaningful keywords only.
 
 Usage:
-  python scripts/backfill_keywords.py [--dry-run]
+  python -m scripts.backfill_keywords [--dry-run]
 """
 
 import os
 import re
 import logging
 import argparse
+from collections import Counter
+from itertools import islice
 
 from dotenv import load_dotenv
 from supabase import create_client
+from postgrest.exceptions import APIError
+
+from scripts.fast_json import use_orjson_for_responses
 
 load_dotenv()
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Article pages carry full HTML content; decode them with orjson when installed
+use_orjson_for_responses()
+
 supabase = create_client(
     os.environ['SUPABASE_URL'],
     os.environ['SUPABASE_SERVICE_KEY']
 )
 
-STOP_WORDS = {
+# Articles read per page and written per update request. Keeping the two
+# equal means only one page of article content is resident at a time.
+BATCH_SIZE = 500
+PAGE_SIZE = BATCH_SIZE
+
+# Cleared once update_article_keywords() turns out not to exist
+_keywords_rpc_available = True
+
+STOP_WORDS = frozenset({
     'this', 'that', 'with', 'from', 'which', 'their', 'there', 'these',
     'those', 'then', 'than', 'them', 'they', 'been', 'being', 'were',
     'have', 'having', 'does', 'doing', 'done', 'will', 'would', 'could',
@@ -67,21 +83,36 @@ STOP_WORDS = {
     'type', 'types', 'understanding', 'without',
     'adsbygoogle', 'window', 'push', 'pagead', 'script', 'class',
     'style', 'href', 'http', 'https', 'data', 'content', 'users',
-}
+})
 
 
-def extract_keywords(content: str, max_keywords: int = 10) -> list:
-    """Extract meaningful keywords from content, filtering stop words."""
-    clean_text = re.sub(r'<[^>]+>', '', content)
-    words = re.findall(r'\b[a-z]{4,}\b', clean_text.lower())
+_TAG_RE = re.compile(r'<[^>]+>')
+_WORD_RE = re.compile(r'\b[a-z]{4,}\b')
 
-    word_freq = {}
-    for word in words:
-        if word not in STOP_WORDS:
-            word_freq[word] = word_freq.get(word, 0) + 1
 
-    sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-    return [word for word, freq in sorted_words[:max_keywords]]
+def extract_keywords(content: str, max_keywords: int = 10) -> list:
+    """Extract meaningful keywords from content, filtering stop words."""
+    # Count every word in one C-level pass, then drop the stop words present;
+    # cheaper than filtering word-by-word, and faster than folding the stop
+    # words into the regex as a negative-lookahead alternation
+    word_freq = Counter(_WORD_RE.findall(_TAG_RE.sub('', content).lower()))
+    for word in STOP_WORDS.intersection(word_freq):
+        del word_freq[word]
+    return [word for word, freq in word_freq.most_common(max_keywords)]
+
+
+def extract_keywords_batch(contents: list, max_keywords: int = 10) -> list:
+    """Extract keywords for many documents, binding the regex methods once."""
+    strip_tags = _TAG_RE.sub
+    find_words = _WORD_RE.findall
+    drop_words = STOP_WORDS.intersection
+    results = []
+    for content in contents:
+        word_freq = Counter(find_words(strip_tags('', content).lower()))
+        for word in drop_words(word_freq):
+            del word_freq[word]
+        results.append([word for word, freq in word_freq.most_common(max_keywords)])
+    return results
 
 
 def has_stop_words(keywords: list) -> bool:
@@ -89,40 +120,113 @@ def has_stop_words(keywords: list) -> bool:
     return any(kw.lower() in STOP_WORDS for kw in keywords)
 
 
+def fetch_articles_needing_backfill():
+    """
+    Yield articles whose keywords are empty or contain a stop word.
+
+    The filter runs server-side so clean articles' content is never
+    transferred. Pages are walked by id (keyset) rather than offset, since
+    rows updated mid-run drop out of the filter.
+    """
+    stop_words = ','.join(sorted(STOP_WORDS))
+    last_id = None
+
+    while True:
+        query = supabase.table('articles') \
+            .select('id, slug, content, keywords') \
+            .or_(f'keywords.is.null,keywords.eq.{{}},keywords.ov.{{{stop_words}}}') \
+            .order('id') \
+            .limit(PAGE_SIZE)
+        if last_id:
+            query = query.gt('id', last_id)
+
+        rows = query.execute().data or []
+        yield from rows
+
+        if len(rows) < PAGE_SIZE:
+            return
+        last_id = rows[-1]['id']
+
+
+def flush_updates(payload: list) -> int:
+    """
+    Write a batch of {id, keywords} updates. Returns rows updated.
+
+    Uses the update_article_keywords() database function (one request that
+    carries only ids and keywords); falls back to one update per article if
+    the function hasn't been created yet.
+    """
+    global _keywords_rpc_available
+    if not payload:
+        return 0
+
+    if _keywords_rpc_available:
+        try:
+            result = supabase.rpc('update_article_keywords', {'payload': payload}).execute()
+            return result.data or 0
+        except APIError as e:
+            if e.code != 'PGRST202':
+                logger.warning(f"    Failed to update batch of {len(payload)}: {e}")
+                return 0
+            logger.warning(
+                "update_article_keywords() not found (run migrate_update_article_keywords_rpc.sql); "
+                "updating articles one at a time"
+            )
+            _keywords_rpc_available = False
+        except Exception as e:
+            logger.warning(f"    Failed to update batch of {len(payload)}: {e}")
+            return 0
+
+    updated = 0
+    for row in payload:
+        try:
+            result = supabase.table('articles') \
+                .update({'keywords': row['keywords']}) \
+                .eq('id', row['id']) \
+                .execute()
+            updated += len(result.data or [])
+        except Exception as e:
+            logger.warning(f"    Failed to update article {row['id']}: {e}")
+    return updated
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('--dry-run', action='store_true', help='Show changes without updating')
     args = parser.parse_args()
 
-    logger.info("Fetching all articles...")
-    articles = supabase.table('articles').select('id, slug, title, content, keywords').execute().data or []
-    logger.info(f"Found {len(articles)} articles")
+    logger.info("Fetching articles with missing or stop-word keywords...")
 
     updated = 0
     skipped = 0
-
-    for article in articles:
-        old_kw = article.get('keywords') or []
-
-        if not has_stop_words(old_kw) and len(old_kw) > 0:
-            skipped += 1
-            continue
-
-        new_kw = extract_keywords(article['content'])
-
-        logger.info(f"  {article['slug']}")
-        logger.info(f"    OLD: {old_kw[:5]}")
-        logger.info(f"    NEW: {new_kw[:5]}")
-
-        if not args.dry_run:
-            try:
-                supabase.table('articles').update({'keywords': new_kw}).eq('id', article['id']).execute()
-                updated += 1
-            except Exception as e:
-                logger.warning(f"    Failed to update: {e}")
+    found = 0
+    articles = fetch_articles_needing_backfill()
+
+    while batch := list(islice(articles, BATCH_SIZE)):
+        found += len(batch)
+        stale = [
+            a for a in batch
+            if not a.get('keywords') or has_stop_words(a['keywords'])
+        ]
+        skipped += len(batch) - len(stale)
+
+        new_keywords = extract_keywords_batch([a['content'] for a in stale])
+        payload = []
+
+        for article, new_kw in zip(stale, new_keywords):
+            old_kw = article.get('keywords') or []
+            logger.info(f"  {article['slug']}")
+            logger.info(f"    OLD: {old_kw[:5]}")
+            logger.info(f"    NEW: {new_kw[:5]}")
+
+            payload.append({'id': article['id'], 'keywords': new_kw})
+
+        if args.dry_run:
+            updated += len(payload)
         else:
-            updated += 1
+            updated += flush_updates(payload)
 
+    logger.info(f"Found {found} articles needing keywords")
     logger.info(f"\nDone! Updated: {updated}, Skipped (already clean): {skipped}")
     if args.dry_run:
         logger.info("(dry run - no changes made)")
@@ -5,17 +5,25 @@ Searches article titles against all trending source APIs to find matches,
 then inserts the source data into the trending_sources table.
 
 Usage:
-  python scripts/backfill_sources.py [--dry-run]
+  python scripts/backfill_sources.py [--dry-run] [--refresh]
 """
 
 import os
 import sys
 import re
+import json
+import time
+import functools
+import tempfile
 import logging
 import argparse
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import requests
+from requests.adapters import HTTPAdapter
+from lxml import etree
 from dotenv import load_dotenv
 from supabase import create_client
 
@@ -29,38 +37,147 @@ supabase = create_client(
     os.environ['SUPABASE_SERVICE_KEY']
 )
 
+# Concurrent item requests when HackerNews falls back to the Firebase API
+HN_WORKERS = 16
 
-def normalize(text: str) -> set:
-    """Extract significant words for comparison."""
-    return {w for w in re.findall(r'[a-z0-9]+', text.lower()) if len(w) > 2}
+# trending_sources rows per insert request
+INSERT_BATCH_SIZE = 500
+
+# Fetched source titles are reused across runs for this long (seconds)
+SOURCE_CACHE_PATH = os.path.join(tempfile.gettempdir(), 'nexus_backfill_sources.json')
+SOURCE_CACHE_TTL = 600
+
+# Shared keep-alive session for all source fetches. Each source host sees at
+# most HN_WORKERS concurrent requests (the Firebase item fallback).
+session = requests.Session()
+session.mount('https://', HTTPAdapter(pool_maxsize=HN_WORKERS))
+
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize(text: str) -> frozenset:
+    """Extract significant words for comparison (cached per title)."""
+    return frozenset(w for w in _TOKEN_RE.findall(text.lower()) if len(w) > 2)
 
 
 def similarity(a: str, b: str) -> float:
     """Jaccard similarity between two strings."""
     words_a = normalize(a)
     words_b = normalize(b)
-    if not words_a or not words_b:
+    inter = len(words_a & words_b)
+    if not inter:
         return 0.0
-    return len(words_a & words_b) / len(words_a | words_b)
+    return inter / (len(words_a) + len(words_b) - inter)
+
+
+def build_source_index(sources: list) -> tuple:
+    """Tokenize source titles once and map each token to the sources using it."""
+    src_tokens = [normalize(src['title']) for src in sources]
+    index = defaultdict(set)
+    for i, tokens in enumerate(src_tokens):
+        for token in tokens:
+            index[token].add(i)
+    return src_tokens, index
+
+
+def find_best_source(title: str, sources: list, src_tokens: list, index: dict) -> tuple:
+    """
+    Return (best_source, score) for a title, scoring only sources that
+    share at least one token with it. Returns (None, 0.0) when none do.
+    """
+    words = normalize(title)
+    candidates = set().union(*(index.get(t, ()) for t in words))
+
+    best_match = None
+    best_score = 0.0
+    n_words = len(words)
+    # Ascending order keeps the first-listed source on ties, as a full scan would
+    for i in sorted(candidates):
+        other = src_tokens[i]
+        n_other = len(other)
+        # Jaccard can't exceed min/max of the set sizes; skip sources that
+        # couldn't beat the current best before intersecting
+        if min(n_words, n_other) <= best_score * max(n_words, n_other):
+            continue
+        inter = len(words & other)
+        sim = inter / (n_words + n_other - inter)
+        if sim > best_score:
+            best_score = sim
+            best_match = sources[i]
+    return best_match, best_score
+
+
+def _parse_feed(content: bytes):
+    """
+    Parse an RSS/Atom payload with lxml, recovering from malformed markup.
+    A parser is built per call: lxml parsers must not be shared across the
+    fetcher threads.
+    """
+    root = etree.fromstring(content, etree.XMLParser(recover=True))
+    if root is None:
+        raise ValueError("empty or unparseable feed")
+    return root
+
+
+def _fetch_hn_algolia(limit: int) -> list:
+    """Front-page stories from Algolia's HN search API, in one request."""
+    resp = session.get(
+        'https://hn.algolia.com/api/v1/search',
+        params={'tags': 'front_page', 'hitsPerPage': limit},
+        timeout=10,
+    )
+    resp.raise_for_status()
+    results = []
+    for hit in resp.json().get('hits', []):
+        if hit.get('title'):
+            results.append({
+                'title': hit['title'],
+                'source': 'hackernews',
+                'score': hit.get('points') or 0,
+                'url': hit.get('url') or f"https://news.ycombinator.com/item?id={hit['objectID']}",
+            })
+    return results
+
+
+def _fetch_hn_firebase(limit: int) -> list:
+    """Top stories from the official Firebase API: the ID list, then each item."""
+    resp = session.get('https://hacker-news.firebaseio.com/v0/topstories.json', timeout=10)
+    resp.raise_for_status()
+    ids = resp.json()[:limit]
+
+    def fetch_item(sid):
+        try:
+            return session.get(f'https://hacker-news.firebaseio.com/v0/item/{sid}.json', timeout=5).json()
+        except Exception as e:
+            logger.warning(f"HN item {sid} failed: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=HN_WORKERS) as executor:
+        stories = list(executor.map(fetch_item, ids))
+
+    results = []
+    for sid, story in zip(ids, stories):
+        if story and 'title' in story:
+            results.append({
+                'title': story['title'],
+                'source': 'hackernews',
+                'score': story.get('score', 0),
+                'url': story.get('url', f'https://news.ycombinator.com/item?id={sid}'),
+            })
+    return results
 
 
 def fetch_hackernews_titles(limit=30):
-    """Fetch recent HackerNews top story titles."""
+    """Fetch current HackerNews front-page story titles, via Algolia with a Firebase fallback."""
     try:
-        resp = requests.get('https://hacker-news.firebaseio.com/v0/topstories.json', timeout=10)
-        ids = resp.json()[:limit]
-        results = []
-        for sid in ids:
-            r = requests.get(f'https://hacker-news.firebaseio.com/v0/item/{sid}.json', timeout=5)
-            story = r.json()
-            if story and 'title' in story:
-                results.append({
-                    'title': story['title'],
-                    'source': 'hackernews',
-                    'score': story.get('score', 0),
-                    'url': story.get('url', f'https://news.ycombinator.com/item?id={sid}'),
-                })
-        return results
+        return _fetch_hn_algolia(limit)
+    except Exception as e:
+        logger.warning(f"HN Algolia fetch failed, falling back to topstories: {e}")
+
+    try:
+        return _fetch_hn_firebase(limit)
     except Exception as e:
         logger.warning(f"HN fetch failed: {e}")
         return []
@@ -68,7 +185,7 @@ def fetch_hackernews_titles(limit=30):
 
 def fetch_devto_titles(limit=30):
     try:
-        resp = requests.get('https://dev.to/api/articles', params={'top': 7, 'per_page': limit}, timeout=10)
+        resp = session.get('https://dev.to/api/articles', params={'top': 7, 'per_page': limit}, timeout=10)
         return [{'title': a['title'], 'source': 'devto', 'score': a.get('public_reactions_count', 0), 'url': a.get('url', '')} for a in resp.json()]
     except Exception as e:
         logger.warning(f"Dev.to fetch failed: {e}")
@@ -76,7 +193,6 @@ def fetch_devto_titles(limit=30):
 
 
 def fetch_rss_titles():
-    import xml.etree.ElementTree as ET
     results = []
     feeds = [
         ('https://techcrunch.com/feed/', 'techcrunch'),
@@ -84,8 +200,8 @@ def fetch_rss_titles():
     ]
     for url, source in feeds:
         try:
-            resp = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
-            root = ET.fromstring(resp.text)
+            resp = session.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
+            root = _parse_feed(resp.content)
             items = root.findall('.//{http://www.w3.org/2005/Atom}entry') or root.findall('.//item')
             for idx, item in enumerate(items[:30]):
                 title = item.find('{http://www.w3.org/2005/Atom}title')
@@ -105,11 +221,10 @@ def fetch_rss_titles():
 
 
 def fetch_producthunt_titles():
-    import xml.etree.ElementTree as ET
     atom_ns = '{http://www.w3.org/2005/Atom}'
     try:
-        resp = requests.get('https://www.producthunt.com/feed', headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
-        root = ET.fromstring(resp.text)
+        resp = session.get('https://www.producthunt.com/feed', headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
+        root = _parse_feed(resp.content)
         entries = root.findall(f'{atom_ns}entry')
         results = []
         for idx, entry in enumerate(entries[:20]):
@@ -124,12 +239,11 @@ def fetch_producthunt_titles():
 
 
 def fetch_google_trends_titles():
-    import xml.etree.ElementTree as ET
     results = []
     for geo in ['US', 'UK', 'CA']:
         try:
-            resp = requests.get(f'https://trends.google.com/trending/rss?geo={geo}', headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
-            root = ET.fromstring(resp.text)
+            resp = session.get(f'https://trends.google.com/trending/rss?geo={geo}', headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
+            root = _parse_feed(resp.content)
             for idx, item in enumerate(root.findall('.//item/title')[:15]):
                 if item.text:
                     results.append({'title': item.text, 'source': 'google_trends', 'score': 15 - idx, 'url': ''})
@@ -138,65 +252,109 @@ def fetch_google_trends_titles():
     return results
 
 
+def fetch_articles_missing_sources() -> list:
+    """
+    Published articles with no trending_sources row. Uses the
+    articles_missing_sources view (anti-join in Postgres); falls back to
+    diffing both tables locally if the migration hasn't been applied.
+    """
+    try:
+        return supabase.table('articles_missing_sources').select('id, slug, title').execute().data or []
+    except Exception as e:
+        logger.warning(f"articles_missing_sources view unavailable ({e}), diffing tables locally")
+
+    all_articles = supabase.table('articles').select('id, slug, title').eq('published', True).execute().data or []
+    existing_sources = supabase.table('trending_sources').select('article_id').execute().data or []
+    existing_ids = {s['article_id'] for s in existing_sources}
+    return [a for a in all_articles if a['id'] not in existing_ids]
+
+
+def load_cached_sources():
+    """Return source titles from the last run if still fresh, else None."""
+    try:
+        if time.time() - os.path.getmtime(SOURCE_CACHE_PATH) > SOURCE_CACHE_TTL:
+            return None
+        with open(SOURCE_CACHE_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_sources(sources: list) -> None:
+    try:
+        with open(SOURCE_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(sources, f)
+    except OSError as e:
+        logger.warning(f"Could not write source cache: {e}")
+
+
+def fetch_all_sources() -> list:
+    """Fetch titles from every source concurrently, in a fixed source order."""
+    fetchers = [
+        fetch_hackernews_titles,
+        fetch_devto_titles,
+        fetch_rss_titles,
+        fetch_producthunt_titles,
+        fetch_google_trends_titles,
+    ]
+    all_sources = []
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+        futures = [executor.submit(fn) for fn in fetchers]
+        # Collect in submission order so source priority on ties is stable
+        for future in futures:
+            all_sources.extend(future.result())
+    return all_sources
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('--dry-run', action='store_true', help='Only show matches, do not insert')
     parser.add_argument('--threshold', type=float, default=0.35, help='Similarity threshold (default 0.35)')
+    parser.add_argument('--refresh', action='store_true', help='Ignore cached source titles and refetch')
     args = parser.parse_args()
 
     # 1. Get articles without source
     logger.info("Fetching articles without source data...")
-    all_articles = supabase.table('articles').select('id, slug, title').eq('published', True).execute().data or []
-    existing_sources = supabase.table('trending_sources').select('article_id').execute().data or []
-    existing_ids = {s['article_id'] for s in existing_sources}
-
-    missing = [a for a in all_articles if a['id'] not in existing_ids]
-    logger.info(f"Found {len(missing)} articles without source (out of {len(all_articles)} total)")
+    missing = fetch_articles_missing_sources()
+    logger.info(f"Found {len(missing)} articles without source")
 
     if not missing:
         logger.info("All articles have source data. Nothing to do.")
         return
 
     # 2. Fetch all source titles
-    logger.info("Fetching titles from all sources...")
-    all_sources = []
-    all_sources.extend(fetch_hackernews_titles())
-    all_sources.extend(fetch_devto_titles())
-    all_sources.extend(fetch_rss_titles())
-    all_sources.extend(fetch_producthunt_titles())
-    all_sources.extend(fetch_google_trends_titles())
-    logger.info(f"Fetched {len(all_sources)} source titles")
+    all_sources = None if args.refresh else load_cached_sources()
+    if all_sources is not None:
+        logger.info(f"Using {len(all_sources)} cached source titles (< {SOURCE_CACHE_TTL // 60} min old)")
+    else:
+        logger.info("Fetching titles from all sources...")
+        all_sources = fetch_all_sources()
+        logger.info(f"Fetched {len(all_sources)} source titles")
+        if all_sources:
+            save_cached_sources(all_sources)
 
     # 3. Match articles to sources
+    src_tokens, index = build_source_index(all_sources)
     matched = 0
     unmatched = 0
+    rows = []
     for article in missing:
-        best_match = None
-        best_score = 0.0
-
-        for src in all_sources:
-            sim = similarity(article['title'], src['title'])
-            if sim > best_score:
-                best_score = sim
-                best_match = src
+        best_match, best_score = find_best_source(article['title'], all_sources, src_tokens, index)
 
         if best_match and best_score >= args.threshold:
             matched += 1
             logger.info(f"  MATCH ({best_score:.2f}): \"{article['title'][:50]}\" → {best_match['source']} (\"{best_match['title'][:50]}\")")
 
             if not args.dry_run:
-                try:
-                    supabase.table('trending_sources').insert({
-                        'article_id': article['id'],
-                        'keyword': best_match['title'],
-                        'source': best_match['source'],
-                        'score': best_match.get('score', 0),
-                        'region': 'global',
-                        'url': best_match.get('url'),
-                        'timestamp': datetime.utcnow().isoformat(),
-                    }).execute()
-                except Exception as e:
-                    logger.warning(f"  Failed to insert source for {article['slug']}: {e}")
+                rows.append({
+                    'article_id': article['id'],
+                    'keyword': best_match['title'],
+                    'source': best_match['source'],
+                    'score': best_match.get('score', 0),
+                    'region': 'global',
+                    'url': best_match.get('url'),
+                    'timestamp': datetime.utcnow().isoformat(),
+                })
         else:
             unmatched += 1
             if best_match:
@@ -204,7 +362,21 @@ def main():
             else:
                 logger.info(f"  NO MATCH: \"{article['title'][:60]}\"")
 
-    logger.info(f"\nDone! Matched: {matched}, Unmatched: {unmatched}")
+    # 4. Insert matched sources in batches, skipping articles that gained a
+    # source since the view was read (UNIQUE(article_id)) instead of failing
+    # the whole batch
+    inserted = 0
+    for i in range(0, len(rows), INSERT_BATCH_SIZE):
+        batch = rows[i:i + INSERT_BATCH_SIZE]
+        try:
+            result = supabase.table('trending_sources') \
+                .upsert(batch, on_conflict='article_id', ignore_duplicates=True) \
+                .execute()
+            inserted += len(result.data or [])
+        except Exception as e:
+            logger.warning(f"  Failed to insert batch of {len(batch)} sources: {e}")
+
+    logger.info(f"\nDone! Matched: {matched}, Inserted: {inserted}, Unmatched: {unmatched}")
     if args.dry_run:
         logger.info("(dry run - no changes made)")
 
@@ -0,0 +1,61 @@
+"""
+Circuit Breaker
+
+Thread-safe breaker that stops calling an external endpoint after
+repeated failures, so a dead host costs one timeout instead of one per call.
+"""
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an endpoint whose breaker is open."""
+
+
+class CircuitBreaker:
+    """Opens after `fail_max` consecutive failures; lets one trial call through every `reset_timeout` seconds."""
+
+    def __init__(self, name: str, fail_max: int = 3, reset_timeout: float = 60.0):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_until = 0.0
+        self._lock = threading.Lock()
+
+    def _allow(self) -> bool:
+        with self._lock:
+            if self.failures < self.fail_max:
+                return True
+            now = time.monotonic()
+            if now < self.opened_until:
+                return False
+            # Half-open: this caller makes the trial call, others keep failing fast
+            self.opened_until = now + self.reset_timeout
+            return True
+
+    def call(self, func, *args, **kwargs):
+        """Call func, raising CircuitOpenError without calling it while the breaker is open."""
+        if not self._allow():
+            raise CircuitOpenError(f"{self.name} circuit open")
+
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            with self._lock:
+                self.failures += 1
+                if self.failures >= self.fail_max:
+                    self.opened_until = time.monotonic() + self.reset_timeout
+                tripped = self.failures == self.fail_max
+            if tripped:
+                logger.warning(f"{self.name} failed {self.fail_max} times in a row; "
+                               f"skipping calls for {self.reset_timeout:.0f}s")
+            raise
+
+        with self._lock:
+            self.failures = 0
+        return result
@@ -5,12 +5,30 @@ Handles all database operations for article storage and retrieval
 
 import os
 import time
+import random
 import logging
-from typing import Dict, List, Optional, Any
+import functools
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
+from urllib.parse import urlparse
 from supabase import create_client, Client
 from postgrest.exceptions import APIError
 
+try:
+    import httpx
+    from supabase import ClientOptions
+except ImportError:
+    httpx = None
+    ClientOptions = None
+
+from scripts.fast_json import use_orjson_for_responses
+
+# get_article_by_slug read cache: entries kept and how long they stay fresh
+ARTICLE_CACHE_SIZE = 1024
+ARTICLE_CACHE_TTL = 60  # seconds
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -19,6 +37,32 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _build_client_options():
+    """
+    Client options with one keep-alive (HTTP/2 when h2 is installed) httpx
+    client shared by every PostgREST request, or None to use the defaults.
+    """
+    if httpx is None or ClientOptions is None:
+        return None
+
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=30)
+    try:
+        http_client = httpx.Client(http2=True, limits=limits, timeout=30)
+    except ImportError:
+        # h2 not installed: keep-alive over HTTP/1.1
+        http_client = httpx.Client(limits=limits, timeout=30)
+
+    try:
+        return ClientOptions(httpx_client=http_client)
+    except TypeError:
+        # Older supabase-py without httpx_client support
+        http_client.close()
+        return None
+
+
+use_orjson_for_responses()
+
+
 class DatabaseClient:
     """Supabase database client with retry logic and error handling"""
 
@@ -33,14 +77,33 @@ class DatabaseClient:
                 "SUPABASE_SERVICE_KEY environment variables."
             )
 
-        self.client: Client = create_client(self.supabase_url, self.supabase_key)
+        # This client speaks HTTP to PostgREST, which pools its own Postgres
+        # connections; a Postgres DSN or Supavisor pooler host (port 6543)
+        # belongs to raw-SQL clients and is a misconfiguration here
+        parsed = urlparse(self.supabase_url)
+        if parsed.scheme.startswith('postgres') or (parsed.hostname or '').endswith('pooler.supabase.com'):
+            raise ValueError(
+                "SUPABASE_URL must be the project API URL (https://<ref>.supabase.co), "
+                "not a Postgres connection string or pooler host."
+            )
+
+        options = _build_client_options()
+        if options:
+            self.client: Client = create_client(self.supabase_url, self.supabase_key, options=options)
+        else:
+            self.client: Client = create_client(self.supabase_url, self.supabase_key)
         self.max_retries = 3
         self.retry_delay = 1  # seconds
+        self._create_rpc_available = True
+        self._image_rpc_available = True
+        self._article_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._article_cache_lock = threading.Lock()
 
-        logger.info("Supabase client initialized successfully")
+        logger.info(f"Supabase client initialized successfully ({parsed.hostname}, "
+                    f"PostgREST over {'shared keep-alive' if options else 'default'} HTTP client)")
 
     def _retry_operation(self, operation, *args, **kwargs) -> Any:
-        """Execute operation with exponential backoff retry logic"""
+        """Execute operation with jittered exponential backoff retry logic"""
         last_exception = None
 
         for attempt in range(self.max_retries):
@@ -49,10 +112,11 @@ class DatabaseClient:
             except APIError as e:
                 last_exception = e
                 if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2 ** attempt)
+                    # Jitter keeps concurrent workers from retrying in lockstep
+                    delay = self.retry_delay * (2 ** attempt) * (0.5 + random.random())
                     logger.warning(
                         f"Database operation failed (attempt {attempt + 1}/{self.max_retries}). "
-                        f"Retrying in {delay}s... Error: {str(e)}"
+                        f"Retrying in {delay:.1f}s... Error: {str(e)}"
                     )
                     time.sleep(delay)
                 else:
@@ -63,6 +127,31 @@ class DatabaseClient:
 
         raise last_exception
 
+    def _cached_article(self, slug: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh cached copy of an article, or None"""
+        with self._article_cache_lock:
+            entry = self._article_cache.get(slug)
+            if entry is None:
+                return None
+            expires, article = entry
+            if expires < time.monotonic():
+                del self._article_cache[slug]
+                return None
+            self._article_cache.move_to_end(slug)
+            return dict(article)
+
+    def _cache_article(self, slug: str, article: Dict[str, Any]) -> None:
+        with self._article_cache_lock:
+            self._article_cache[slug] = (time.monotonic() + ARTICLE_CACHE_TTL, dict(article))
+            self._article_cache.move_to_end(slug)
+            if len(self._article_cache) > ARTICLE_CACHE_SIZE:
+                self._article_cache.popitem(last=False)
+
+    def _invalidate_articles(self, slugs) -> None:
+        with self._article_cache_lock:
+            for slug in slugs:
+                self._article_cache.pop(slug, None)
+
     def test_connection(self) -> bool:
         """Test database connection"""
         try:
@@ -91,7 +180,7 @@ class DatabaseClient:
         source_data: Optional[Dict[str, Any]] = None
     ) -> Optional[Dict[str, Any]]:
         """
-        Create a new article in the database
+        Create a new article in the database (single-row create_articles)
 
         Args:
             slug: URL-friendly article identifier
@@ -109,69 +198,185 @@ class DatabaseClient:
             source_data: Trending source information dict
 
         Returns:
-            Created article dict or None on failure
+            Created article dict, or None on failure or if the slug exists
         """
-        try:
-            # Prepare article data
-            article_data = {
-                'slug': slug,
-                'title': title,
-                'content': content,
-                'meta_description': meta_description,
-                'keywords': keywords or [],
-                'reading_time': reading_time,
-                'word_count': word_count,
-                'topic': topic,
-                'published': published,
-                'featured_image': featured_image,
-                'image_attribution': image_attribution or {},
-                'author': author or {
-                    'name': 'NexusTopic Editorial Team',
-                    'bio': 'Delivering the latest trending topics and insights'
-                }
-            }
+        created = self.create_articles([{
+            'slug': slug,
+            'title': title,
+            'content': content,
+            'meta_description': meta_description,
+            'keywords': keywords,
+            'reading_time': reading_time,
+            'word_count': word_count,
+            'topic': topic,
+            'published': published,
+            'featured_image': featured_image,
+            'image_attribution': image_attribution,
+            'author': author,
+            'source_data': source_data,
+        }])
+
+        if not created:
+            logger.warning(f"Article '{slug}' not created (slug exists or insert failed)")
+            return None
 
-            # Insert article
-            def insert_article():
-                return self.client.table('articles').insert(article_data).execute()
+        article = created[0]
+        logger.info(f"Article created successfully: {slug} (ID: {article['id']})")
+        return article
 
-            result = self._retry_operation(insert_article)
+    def create_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create several articles and their trending sources, skipping slugs
+        that already exist
 
-            if not result.data:
-                logger.error("Article creation returned no data")
-                return None
+        Uses the create_articles_with_sources() database function (one
+        round-trip, one transaction); falls back to two bulk inserts if the
+        function hasn't been created yet.
+
+        Args:
+            articles: Dicts of create_article keyword arguments (including
+                      optional source_data)
+
+        Returns:
+            List of created article dicts (existing slugs are not included)
+        """
+        if not articles:
+            return []
+
+        if self._create_rpc_available:
+            try:
+                return self._create_articles_rpc(articles)
+            except APIError as e:
+                if e.code != 'PGRST202':
+                    logger.error(f"Failed to create {len(articles)} articles: {str(e)}")
+                    return []
+                logger.warning(
+                    "create_articles_with_sources() not found (run migrate_create_articles_rpc.sql); "
+                    "using separate article and source inserts"
+                )
+                self._create_rpc_available = False
+            except Exception as e:
+                logger.error(f"Failed to create {len(articles)} articles: {str(e)}")
+                return []
+
+        return self._create_articles_two_step(articles)
+
+    def _create_articles_rpc(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert articles and sources atomically via create_articles_with_sources()"""
+        payload = []
+        for a in articles:
+            row = self._article_row(**{k: v for k, v in a.items() if k != 'source_data'})
+            if a.get('source_data'):
+                row['source_data'] = self._source_row(None, a['source_data'])
+            payload.append(row)
+
+        def create_op():
+            return self.client.rpc('create_articles_with_sources', {'payload': payload}).execute()
+
+        result = self._retry_operation(create_op)
+        created = result.data or []
+        logger.info(f"Created {len(created)}/{len(articles)} articles (with sources, one transaction)")
+        return created
+
+    def _create_articles_two_step(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert articles, then their trending sources, as two bulk requests"""
+        try:
+            rows = [
+                self._article_row(**{k: v for k, v in a.items() if k != 'source_data'})
+                for a in articles
+            ]
 
-            article = result.data[0]
-            article_id = article['id']
-            logger.info(f"Article created successfully: {slug} (ID: {article_id})")
+            # ON CONFLICT (slug) DO NOTHING: never overwrite an existing article
+            def insert_articles():
+                return self.client.table('articles')\
+                    .upsert(rows, on_conflict='slug', ignore_duplicates=True)\
+                    .execute()
 
-            # Insert trending source data if provided
-            if source_data and article_id:
+            result = self._retry_operation(insert_articles)
+            created = result.data or []
+            logger.info(f"Created {len(created)}/{len(articles)} articles")
+
+            # Insert trending source data for the created articles in one request
+            source_by_slug = {a['slug']: a.get('source_data') for a in articles}
+            source_records = [
+                self._source_row(article['id'], source_by_slug[article['slug']])
+                for article in created
+                if source_by_slug.get(article['slug'])
+            ]
+            if source_records:
                 try:
-                    source_record = {
-                        'article_id': article_id,
-                        'keyword': source_data.get('keyword', ''),
-                        'source': source_data.get('source', 'google_trends'),
-                        'score': source_data.get('score', 0),
-                        'region': source_data.get('region', 'US'),
-                        'url': source_data.get('url'),
-                        'timestamp': source_data.get('timestamp', datetime.utcnow().isoformat())
-                    }
-
-                    def insert_source():
-                        return self.client.table('trending_sources').insert(source_record).execute()
-
-                    self._retry_operation(insert_source)
-                    logger.info(f"Trending source data added for article: {slug}")
+                    def insert_sources():
+                        return self.client.table('trending_sources').insert(source_records).execute()
+
+                    self._retry_operation(insert_sources)
+                    logger.info(f"Trending source data added for {len(source_records)} articles")
                 except Exception as e:
                     logger.warning(f"Failed to insert trending source data: {str(e)}")
-                    # Don't fail the whole operation if source insertion fails
 
-            return article
+            return created
 
         except Exception as e:
-            logger.error(f"Failed to create article '{slug}': {str(e)}")
-            return None
+            logger.error(f"Failed to create {len(articles)} articles: {str(e)}")
+            return []
+
+    @staticmethod
+    def _article_row(
+        slug: str,
+        title: str,
+        content: str,
+        meta_description: Optional[str] = None,
+        keywords: Optional[List[str]] = None,
+        reading_time: int = 5,
+        word_count: int = 0,
+        topic: Optional[str] = None,
+        published: bool = True,
+        featured_image: Optional[str] = None,
+        image_attribution: Optional[Dict[str, str]] = None,
+        author: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Build an articles table row, filling in defaults"""
+        return {
+            'slug': slug,
+            'title': title,
+            'content': content,
+            'meta_description': meta_description,
+            'keywords': keywords or [],
+            'reading_time': reading_time,
+            'word_count': word_count,
+            'topic': topic,
+            'published': published,
+            'featured_image': featured_image,
+            'image_attribution': image_attribution or {},
+            'author': author or {
+                'name': 'NexusTopic Editorial Team',
+                'bio': 'Delivering the latest trending topics and insights'
+            }
+        }
+
+    @staticmethod
+    def _source_row(article_id: str, source_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a trending_sources table row for an article"""
+        return {
+            'article_id': article_id,
+            'keyword': source_data.get('keyword', ''),
+            'source': source_data.get('source', 'google_trends'),
+            'score': source_data.get('score', 0),
+            'region': source_data.get('region', 'US'),
+            'url': source_data.get('url'),
+            'timestamp': source_data.get('timestamp', datetime.utcnow().isoformat())
+        }
+
+    @staticmethod
+    def _attach_source(article: Dict[str, Any]) -> Dict[str, Any]:
+        """Move an embedded trending_sources row to article['source_data']"""
+        # UNIQUE(article_id) makes this one-to-one, which PostgREST embeds as
+        # an object; older versions return a list
+        source = article.pop('trending_sources', None)
+        if isinstance(source, list):
+            source = source[0] if source else None
+        if source:
+            article['source_data'] = source
+        return article
 
     def get_article_by_slug(self, slug: str) -> Optional[Dict[str, Any]]:
         """
@@ -183,9 +388,17 @@ class DatabaseClient:
         Returns:
             Article dict or None if not found
         """
+        cached = self._cached_article(slug)
+        if cached is not None:
+            return cached
+
         try:
+            # Embed the trending source so article and source arrive in one request
             def fetch_article():
-                return self.client.table('articles').select('*').eq('slug', slug).execute()
+                return self.client.table('articles')\
+                    .select('*, trending_sources(*)')\
+                    .eq('slug', slug)\
+                    .execute()
 
             result = self._retry_operation(fetch_article)
 
@@ -193,22 +406,8 @@ class DatabaseClient:
                 logger.warning(f"Article not found: {slug}")
                 return None
 
-            article = result.data[0]
-
-            # Fetch associated trending source data
-            try:
-                def fetch_source():
-                    return self.client.table('trending_sources')\
-                        .select('*')\
-                        .eq('article_id', article['id'])\
-                        .execute()
-
-                source_result = self._retry_operation(fetch_source)
-                if source_result.data:
-                    article['source_data'] = source_result.data[0]
-            except Exception as e:
-                logger.warning(f"Failed to fetch source data for {slug}: {str(e)}")
-
+            article = self._attach_source(result.data[0])
+            self._cache_article(slug, article)
             return article
 
         except Exception as e:
@@ -221,8 +420,9 @@ class DatabaseClient:
         offset: int = 0,
         published_only: bool = True,
         order_by: str = 'created_at',
-        ascending: bool = False
-    ) -> List[Dict[str, Any]]:
+        ascending: bool = False,
+        return_count: bool = False
+    ) -> Union[List[Dict[str, Any]], Tuple[List[Dict[str, Any]], int]]:
         """
         List articles with pagination
 
@@ -232,13 +432,19 @@ class DatabaseClient:
             published_only: Only return published articles
             order_by: Field to order by
             ascending: Sort order (False = descending)
+            return_count: Also return the estimated total row count
 
         Returns:
-            List of article dicts
+            List of article dicts, or (articles, total) if return_count is set
         """
         try:
             def fetch_articles():
-                query = self.client.table('articles').select('*')
+                # count='estimated' reads the planner's row estimate for large
+                # tables instead of running a full COUNT(*)
+                if return_count:
+                    query = self.client.table('articles').select('*', count='estimated')
+                else:
+                    query = self.client.table('articles').select('*')
 
                 if published_only:
                     query = query.eq('published', True)
@@ -251,11 +457,13 @@ class DatabaseClient:
             result = self._retry_operation(fetch_articles)
 
             logger.info(f"Listed {len(result.data)} articles (offset={offset}, limit={limit})")
+            if return_count:
+                return result.data, result.count or 0
             return result.data
 
         except Exception as e:
             logger.error(f"Failed to list articles: {str(e)}")
-            return []
+            return ([], 0) if return_count else []
 
     def check_slug_exists(self, slug: str) -> bool:
         """
@@ -269,13 +477,14 @@ class DatabaseClient:
         """
         try:
             def check_slug():
+                # HEAD request: PostgREST returns only the count header, no rows
                 return self.client.table('articles')\
-                    .select('id')\
+                    .select('id', count='exact', head=True)\
                     .eq('slug', slug)\
                     .execute()
 
             result = self._retry_operation(check_slug)
-            exists = len(result.data) > 0
+            exists = (result.count or 0) > 0
 
             if exists:
                 logger.info(f"Slug already exists: {slug}")
@@ -301,6 +510,7 @@ class DatabaseClient:
         Returns:
             Updated article dict or None on failure
         """
+        self._invalidate_articles([slug])
         try:
             def update_op():
                 return self.client.table('articles')\
@@ -321,6 +531,109 @@ class DatabaseClient:
             logger.error(f"Failed to update article '{slug}': {str(e)}")
             return None
 
+    def update_article_images(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Set the cover image of many existing articles
+
+        Uses the update_article_images() database function (one round-trip,
+        UPDATE only, so a slug deleted meanwhile is skipped rather than
+        re-inserted); falls back to one update per article if the function
+        hasn't been created yet.
+
+        Args:
+            rows: Dicts of slug, featured_image and image_attribution
+
+        Returns:
+            Number of articles updated
+        """
+        if not rows:
+            return 0
+
+        payload = [
+            {
+                'slug': row['slug'],
+                'featured_image': row.get('featured_image'),
+                'image_attribution': row.get('image_attribution') or {},
+            }
+            for row in rows
+        ]
+        self._invalidate_articles(row['slug'] for row in payload)
+
+        if self._image_rpc_available:
+            try:
+                def rpc_op():
+                    return self.client.rpc('update_article_images', {'payload': payload}).execute()
+
+                result = self._retry_operation(rpc_op)
+                updated = result.data or 0
+                logger.info(f"Updated images of {updated}/{len(rows)} articles")
+                return updated
+            except APIError as e:
+                if e.code != 'PGRST202':
+                    logger.error(f"Failed to update images of {len(rows)} articles: {str(e)}")
+                    return 0
+                logger.warning(
+                    "update_article_images() not found (run migrate_update_article_images_rpc.sql); "
+                    "updating articles one at a time"
+                )
+                self._image_rpc_available = False
+            except Exception as e:
+                logger.error(f"Failed to update images of {len(rows)} articles: {str(e)}")
+                return 0
+
+        updated = 0
+        for row in payload:
+            slug = row['slug']
+            fields = {k: v for k, v in row.items() if k != 'slug'}
+            try:
+                def update_op():
+                    return self.client.table('articles')\
+                        .update(fields)\
+                        .eq('slug', slug)\
+                        .execute()
+
+                result = self._retry_operation(update_op)
+                updated += len(result.data or [])
+            except Exception as e:
+                logger.error(f"Failed to update image of article '{slug}': {str(e)}")
+        logger.info(f"Updated images of {updated}/{len(rows)} articles")
+        return updated
+
+    def update_articles_by_slugs(
+        self,
+        slugs: List[str],
+        updates: Dict[str, Any]
+    ) -> int:
+        """
+        Apply the same updates to several articles in one request
+
+        Args:
+            slugs: Article slugs to update
+            updates: Dict of fields to update
+
+        Returns:
+            Number of articles updated
+        """
+        if not slugs:
+            return 0
+
+        self._invalidate_articles(slugs)
+        try:
+            def update_op():
+                return self.client.table('articles')\
+                    .update(updates)\
+                    .in_('slug', slugs)\
+                    .execute()
+
+            result = self._retry_operation(update_op)
+            updated = len(result.data or [])
+            logger.info(f"Updated {updated}/{len(slugs)} articles")
+            return updated
+
+        except Exception as e:
+            logger.error(f"Failed to update {len(slugs)} articles: {str(e)}")
+            return 0
+
     def delete_article(self, slug: str) -> bool:
         """
         Delete an article
@@ -331,6 +644,7 @@ class DatabaseClient:
         Returns:
             True if deleted, False otherwise
         """
+        self._invalidate_articles([slug])
         try:
             def delete_op():
                 return self.client.table('articles')\
@@ -375,7 +689,8 @@ class DatabaseClient:
 
     def list_articles_without_images(self) -> List[Dict[str, Any]]:
         """
-        List published articles that have no featured_image set.
+        List published articles that have no featured_image set, with their
+        trending source embedded so callers need no follow-up lookups.
 
         Returns:
             List of article dicts missing featured images
@@ -383,19 +698,68 @@ class DatabaseClient:
         try:
             def fetch_articles():
                 return self.client.table('articles') \
-                    .select('*') \
+                    .select('*, trending_sources(*)') \
                     .eq('published', True) \
                     .or_('featured_image.is.null,featured_image.eq.') \
                     .execute()
 
             result = self._retry_operation(fetch_articles)
             logger.info(f"Found {len(result.data)} articles without images")
-            return result.data
+            return [self._attach_source(article) for article in result.data]
 
         except Exception as e:
             logger.error(f"Failed to list articles without images: {str(e)}")
             return []
 
+    def get_cached_image(self, key: str) -> Optional[str]:
+        """
+        Look up a previously generated image in the prompt cache
+
+        Args:
+            key: Prompt hash key
+
+        Returns:
+            Cached image URL or None on miss
+        """
+        try:
+            def fetch_cached():
+                return self.client.table('prompt_cache')\
+                    .select('image_url')\
+                    .eq('key', key)\
+                    .limit(1)\
+                    .execute()
+
+            result = self._retry_operation(fetch_cached)
+            return result.data[0]['image_url'] if result.data else None
+
+        except Exception as e:
+            logger.warning(f"Failed to read prompt cache '{key}': {str(e)}")
+            return None
+
+    def cache_image(self, key: str, image_url: str) -> bool:
+        """
+        Store a generated image URL in the prompt cache
+
+        Args:
+            key: Prompt hash key
+            image_url: Public URL of the generated image
+
+        Returns:
+            True if stored, False otherwise
+        """
+        try:
+            def upsert_cached():
+                return self.client.table('prompt_cache')\
+                    .upsert({'key': key, 'image_url': image_url}, on_conflict='key')\
+                    .execute()
+
+            self._retry_operation(upsert_cached)
+            return True
+
+        except Exception as e:
+            logger.warning(f"Failed to write prompt cache '{key}': {str(e)}")
+            return False
+
     def get_article_count(self, published_only: bool = True) -> int:
         """
         Get total count of articles
@@ -408,7 +772,7 @@ class DatabaseClient:
         """
         try:
             def count_articles():
-                query = self.client.table('articles').select('id', count='exact')
+                query = self.client.table('articles').select('id', count='exact', head=True)
 
                 if published_only:
                     query = query.eq('published', True)
@@ -416,7 +780,7 @@ class DatabaseClient:
                 return query.execute()
 
             result = self._retry_operation(count_articles)
-            count = result.count if hasattr(result, 'count') else len(result.data)
+            count = result.count or 0
 
             logger.info(f"Article count: {count}")
             return count
@@ -426,18 +790,10 @@ class DatabaseClient:
             return 0
 
 
-# Singleton instance
-_db_client: Optional[DatabaseClient] = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_db_client() -> DatabaseClient:
-    """Get or create singleton database client instance"""
-    global _db_client
-
-    if _db_client is None:
-        _db_client = DatabaseClient()
-
-    return _db_client
+    """Get or create singleton database client instance (one connection pool per process)"""
+    return DatabaseClient()
 
 
 def is_supabase_enabled() -> bool:
@@ -0,0 +1,59 @@
+"""
+Disk Cache
+
+Small thread-safe JSON key/value store with a per-entry TTL, used to
+reuse external API answers (Unsplash searches, AI queries) across runs.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """JSON file in the temp dir mapping keys to (stored_at, value), expiring after `ttl` seconds."""
+
+    def __init__(self, name: str, ttl: float):
+        self.path = os.path.join(tempfile.gettempdir(), f'nexus_{name}.json')
+        self.ttl = ttl
+        self._entries: Optional[Dict[str, list]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, list]:
+        if self._entries is None:
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._load().get(key)
+        if entry and time.time() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value and rewrite the file, dropping expired entries."""
+        with self._lock:
+            entries = self._load()
+            now = time.time()
+            entries[key] = [now, value]
+            for stale in [k for k, (stored_at, _) in entries.items() if now - stored_at >= self.ttl]:
+                del entries[stale]
+            try:
+                tmp_path = f'{self.path}.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(entries, f)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.warning(f"Could not write cache {self.path}: {e}")
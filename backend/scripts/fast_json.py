@@ -0,0 +1,34 @@
+"""
+Fast JSON
+
+Decodes httpx response bodies (and so every PostgREST result) with orjson
+when it is installed. Shared by every module that talks to Supabase, so the
+patch is applied once however many of them are imported.
+"""
+
+try:
+    import httpx
+    import orjson
+except ImportError:
+    httpx = orjson = None
+
+
+def use_orjson_for_responses() -> None:
+    """
+    Patch httpx.Response.json to decode with orjson. Calls with json.loads
+    keyword arguments keep the stock decoder; orjson.JSONDecodeError
+    subclasses json.JSONDecodeError, so empty bodies are handled as before.
+    Safe to call more than once.
+    """
+    if orjson is None or httpx is None or getattr(httpx.Response.json, '_orjson', False):
+        return
+
+    stdlib_json = httpx.Response.json
+
+    def fast_json(self, **kwargs):
+        if kwargs:
+            return stdlib_json(self, **kwargs)
+        return orjson.loads(self.content)
+
+    fast_json._orjson = True
+    httpx.Response.json = fast_json
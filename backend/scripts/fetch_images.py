@@ -9,15 +9,21 @@ Priority:
 
 import io
 import os
+import functools
+import hashlib
+import itertools
+import json
+import threading
 import re
 import time
-import uuid
+import random
 import logging
-import subprocess
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     import google.generativeai as genai
@@ -41,12 +47,61 @@ try:
 except ImportError:
     create_client = None
 
+from scripts.circuit_breaker import CircuitBreaker, CircuitOpenError
+from scripts.disk_cache import DiskCache
+from scripts.rate_limit import RateLimiter
+
 logger = logging.getLogger(__name__)
 
 UNSPLASH_API_URL = "https://api.unsplash.com/search/photos"
 STORAGE_BUCKET = "article-images"
 
-_gemini_cli_path = shutil.which('gemini')
+# Gemini image quota: requests per minute and retries on 429/5xx
+GEMINI_IMAGE_RPM = int(os.getenv('GEMINI_IMAGE_RPM', '20'))
+GEMINI_IMAGE_MAX_RETRIES = 5
+
+# Generated covers are shrunk to fit this box and stored as WebP
+COVER_MAX_SIZE = (1280, 720)
+COVER_WEBP_QUALITY = 85
+
+# Articles processed concurrently when fetching cover images. Provider limits
+# are enforced separately (Gemini token bucket, Unsplash semaphore), so this
+# only sets how much network/upload latency overlaps.
+IMAGE_WORKERS = int(os.getenv('IMAGE_WORKERS', '8'))
+
+# Shared by every thread that calls Gemini image generation
+_gemini_image_limiter = RateLimiter(GEMINI_IMAGE_RPM, per=60.0)
+# Unsplash demo-tier quota, paced only where Unsplash is actually called
+UNSPLASH_REQUESTS_PER_HOUR = int(os.getenv('UNSPLASH_REQUESTS_PER_HOUR', '50'))
+_unsplash_limiter = RateLimiter(
+    UNSPLASH_REQUESTS_PER_HOUR, per=3600.0, burst=UNSPLASH_REQUESTS_PER_HOUR
+)
+
+# Unsplash requests in flight at once, across all threads
+UNSPLASH_CONCURRENCY = 5
+
+# Keep-alive session shared by Unsplash searches and download pings; retries
+# transient gateway errors with backoff (429s are left to the caller)
+_unsplash_session = requests.Session()
+_unsplash_session.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+))
+_unsplash_slots = threading.BoundedSemaphore(UNSPLASH_CONCURRENCY)
+# Stops calling Unsplash for a minute after repeated connection failures
+_unsplash_breaker = CircuitBreaker('Unsplash', fail_max=3, reset_timeout=60)
+# Search results by query, reused across runs; download pings are never cached
+UNSPLASH_CACHE_TTL = int(os.getenv('UNSPLASH_CACHE_TTL', str(24 * 3600)))
+_unsplash_cache = DiskCache('unsplash_searches', ttl=UNSPLASH_CACHE_TTL)
+# AI search queries by article fields, reused across runs
+AI_QUERY_CACHE_TTL = 30 * 24 * 3600
+_ai_query_cache = DiskCache('ai_search_queries', ttl=AI_QUERY_CACHE_TTL)
+# Search-query model called directly over HTTPS when the SDK path fails
+GEMINI_REST_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent"
+_gemini_session = requests.Session()
+# Download-event pings run here so the caller never waits on them
+_unsplash_bg = ThreadPoolExecutor(max_workers=4, thread_name_prefix='unsplash-bg')
 
 
 # ---------------------------------------------------------------------------
@@ -73,8 +128,9 @@ def _build_image_prompt(article: Dict) -> str:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def _get_supabase_client():
-    """Create a Supabase client for storage operations."""
+    """Supabase client for storage operations, created once and reused."""
     if not create_client:
         return None
     url = os.getenv('SUPABASE_URL')
@@ -84,10 +140,18 @@ def _get_supabase_client():
     return create_client(url, key)
 
 
+# Set once the bucket is known to exist, so later uploads skip the lookup
+_bucket_ready = False
+
+
 def _ensure_storage_bucket(supabase_client) -> bool:
     """Ensure the article-images storage bucket exists (public)."""
+    global _bucket_ready
+    if _bucket_ready:
+        return True
     try:
         supabase_client.storage.get_bucket(STORAGE_BUCKET)
+        _bucket_ready = True
         return True
     except Exception:
         pass
@@ -97,15 +161,19 @@ def _ensure_storage_bucket(supabase_client) -> bool:
             options={"public": True},
         )
         logger.info(f"Created storage bucket: {STORAGE_BUCKET}")
+        _bucket_ready = True
         return True
     except Exception as e:
         if "already exists" in str(e).lower():
+            _bucket_ready = True
             return True
         logger.error(f"Failed to create storage bucket: {e}")
         return False
 
 
-def _upload_to_supabase_storage(image_bytes: bytes, filename: str) -> Optional[str]:
+def _upload_to_supabase_storage(
+    image_bytes: bytes, filename: str, content_type: str
+) -> Optional[str]:
     """Upload image bytes to Supabase Storage and return the public URL."""
     client = _get_supabase_client()
     if not client:
@@ -119,7 +187,7 @@ def _upload_to_supabase_storage(image_bytes: bytes, filename: str) -> Optional[s
         client.storage.from_(STORAGE_BUCKET).upload(
             path=filename,
             file=image_bytes,
-            file_options={"content-type": "image/png", "upsert": "true"},
+            file_options={"content-type": content_type, "upsert": "true"},
         )
         public_url = client.storage.from_(STORAGE_BUCKET).get_public_url(filename)
         logger.info(f"  Uploaded to Supabase Storage: {filename}")
@@ -129,6 +197,70 @@ def _upload_to_supabase_storage(image_bytes: bytes, filename: str) -> Optional[s
         return None
 
 
+def _find_stored_image(filename: str) -> Optional[str]:
+    """Public URL of an image already in the storage bucket, or None."""
+    client = _get_supabase_client()
+    if not client:
+        return None
+    try:
+        public_url = client.storage.from_(STORAGE_BUCKET).get_public_url(filename)
+        response = requests.head(public_url, timeout=5)
+        return public_url if response.status_code == 200 else None
+    except Exception:
+        return None
+
+
+def _retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying a rate-limited or 5xx Gemini call, or None if not retryable."""
+    code = getattr(error, 'code', None)
+    message = str(error)
+    retryable = (
+        code in (429, 500, 502, 503, 504)
+        or '429' in message
+        or 'RESOURCE_EXHAUSTED' in message
+    )
+    if not retryable:
+        return None
+
+    # Honour Retry-After when the provider sends one
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    retry_after = headers.get('Retry-After') if headers else None
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+
+    # Exponential backoff with jitter, capped at 30s
+    return min(30.0, 2 ** attempt) + random.uniform(0, 1)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_genai_client(api_key: str):
+    """google-genai client, reused so its HTTP connection pool survives across images."""
+    return genai_new.Client(api_key=api_key)
+
+
+def _generate_image_content(client, prompt: str):
+    """Call the Gemini image model, backing off on 429/5xx responses."""
+    for attempt in range(GEMINI_IMAGE_MAX_RETRIES):
+        try:
+            return client.models.generate_content(
+                model="gemini-2.5-flash-image",
+                contents=prompt,
+                config=genai_types.GenerateContentConfig(
+                    response_modalities=["IMAGE", "TEXT"],
+                ),
+            )
+        except Exception as e:
+            delay = _retry_delay(e, attempt)
+            if delay is None or attempt == GEMINI_IMAGE_MAX_RETRIES - 1:
+                raise
+            logger.warning(f"  Gemini image rate limited ({attempt + 1}/{GEMINI_IMAGE_MAX_RETRIES}), "
+                           f"retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
+
 def generate_gemini_image(article: Dict) -> Optional[str]:
     """
     Generate a cover image using Gemini 2.5 Flash Image model.
@@ -149,15 +281,19 @@ def generate_gemini_image(article: Dict) -> Optional[str]:
 
     prompt = _build_image_prompt(article)
 
+    # Images are stored under a hash of their prompt, so a rerun for the same
+    # article finds the earlier upload instead of paying for a new generation
+    filename = f"{hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:32]}.webp"
+    existing_url = _find_stored_image(filename)
+    if existing_url:
+        logger.info(f"  -> Reusing stored AI image {filename}")
+        return existing_url
+
+    _gemini_image_limiter.acquire()
+
     try:
-        client = genai_new.Client(api_key=api_key)
-        response = client.models.generate_content(
-            model="gemini-2.5-flash-image",
-            contents=prompt,
-            config=genai_types.GenerateContentConfig(
-                response_modalities=["IMAGE", "TEXT"],
-            ),
-        )
+        client = _get_genai_client(api_key)
+        response = _generate_image_content(client, prompt)
 
         # Extract image from response
         if not response.candidates:
@@ -166,18 +302,22 @@ def generate_gemini_image(article: Dict) -> Optional[str]:
 
         for part in response.candidates[0].content.parts:
             if part.inline_data and part.inline_data.mime_type.startswith("image/"):
-                image_data = part.inline_data.data
-                # Convert to PNG via Pillow for consistency
-                img = Image.open(io.BytesIO(image_data))
+                # Downscale to cover size and re-encode as WebP, which is a
+                # fraction of the size of the model's full-resolution PNG. The
+                # decoded bitmap is released before the upload starts;
+                # getvalue() hands over BytesIO's buffer uncopied.
                 buf = io.BytesIO()
-                img.save(buf, format="PNG")
-                png_bytes = buf.getvalue()
-
-                slug = article.get('slug', uuid.uuid4().hex[:12])
-                filename = f"{slug}.png"
-                public_url = _upload_to_supabase_storage(png_bytes, filename)
+                with Image.open(io.BytesIO(part.inline_data.data)) as img:
+                    cover = img.convert("RGB")
+                    cover.thumbnail(COVER_MAX_SIZE, Image.LANCZOS)
+                    cover.save(buf, format="WEBP", quality=COVER_WEBP_QUALITY, method=6)
+                    del cover
+                image_bytes = buf.getvalue()
+                del buf
+
+                public_url = _upload_to_supabase_storage(image_bytes, filename, "image/webp")
                 if public_url:
-                    logger.info(f"  -> AI image generated and uploaded ({len(png_bytes)//1024}KB)")
+                    logger.info(f"  -> AI image generated and uploaded ({len(image_bytes)//1024}KB)")
                     return public_url
 
         logger.warning("  Gemini response contained no image data")
@@ -188,77 +328,253 @@ def generate_gemini_image(article: Dict) -> Optional[str]:
         return None
 
 
+# Generated image URLs by prompt key, for reuse within one run
+_image_cache: Dict[str, str] = {}
+_image_cache_lock = threading.Lock()
+
+
+def _image_cache_key(article: Dict) -> str:
+    """Hash the fields that determine the image prompt's subject."""
+    text = (article.get('topic', '') + article.get('title', '')).lower()
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def generate_gemini_image_cached(article: Dict, db=None) -> Optional[str]:
+    """
+    generate_gemini_image, reusing an image already generated for the same
+    topic + title earlier in this run or (when `db` is given) in a prior run
+    via the prompt_cache table.
+    """
+    key = _image_cache_key(article)
+
+    with _image_cache_lock:
+        image_url = _image_cache.get(key)
+    if not image_url and db:
+        image_url = db.get_cached_image(key)
+    if image_url:
+        logger.info(f"  -> Reusing cached image for prompt {key}")
+        with _image_cache_lock:
+            _image_cache[key] = image_url
+        return image_url
+
+    image_url = generate_gemini_image(article)
+    if image_url:
+        with _image_cache_lock:
+            _image_cache[key] = image_url
+        if db:
+            db.cache_image(key, image_url)
+    return image_url
+
+
 # ---------------------------------------------------------------------------
 # Unsplash Fallback (existing logic)
 # ---------------------------------------------------------------------------
 
+def _query_fields(article: Dict) -> tuple:
+    """The article fields an AI search query is generated from."""
+    return (
+        article.get('title', ''),
+        article.get('topic', ''),
+        article.get('meta_description', ''),
+    )
+
+
+def _query_cache_key(fields: tuple) -> str:
+    """Disk cache key for an article's query fields."""
+    return hashlib.sha1('\x1f'.join(fields).encode('utf-8')).hexdigest()
+
+
 def _build_search_query_with_ai(article: Dict) -> Optional[str]:
     """
     Use Gemini to generate a visually descriptive Unsplash search query.
-    Tries API first, falls back to CLI.
+    Tries the SDK first, falls back to REST. Results are memoized per process
+    and on disk, so later runs skip the model for articles already seen.
     """
-    title = article.get('title', '')
-    description = article.get('meta_description', '')
-    topic = article.get('topic', '')
+    fields = _query_fields(article)
+    key = _query_cache_key(fields)
+    query = _ai_query_cache.get(key)
+    if query:
+        return query
+
+    try:
+        query = _ai_search_query(*fields)
+    except LookupError:
+        return None
+    _ai_query_cache.set(key, query)
+    return query
+
+
+@functools.lru_cache(maxsize=1)
+def _get_query_model(api_key: str):
+    """Gemini text model for search queries, configured once per process."""
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel('gemini-3-flash-preview')
+
+
+def _gemini_rest_query(api_key: str, prompt: str, json_mode: bool = False) -> Optional[str]:
+    """Text reply from the Gemini REST endpoint, for when the SDK is unavailable or fails."""
+    # A few-word answer needs no reasoning; thinking only adds latency
+    generation_config = {'thinkingConfig': {'thinkingBudget': 0}}
+    if json_mode:
+        generation_config['responseMimeType'] = 'application/json'
+    response = _gemini_session.post(
+        GEMINI_REST_URL,
+        headers={'x-goog-api-key': api_key},
+        json={
+            'contents': [{'parts': [{'text': prompt}]}],
+            'generationConfig': generation_config,
+        },
+        timeout=15,
+    )
+    response.raise_for_status()
+    parts = response.json()['candidates'][0]['content']['parts']
+    return ''.join(part.get('text', '') for part in parts).strip() or None
+
+
+def _ask_gemini(prompt: str, json_mode: bool = False) -> Optional[str]:
+    """
+    Text reply from the Gemini SDK, falling back to the REST API; None if
+    both fail. json_mode asks for a bare JSON document, with no prose or
+    code fences around it.
+    """
+    api_key = os.getenv('GOOGLE_API_KEY')
+    if not api_key:
+        return None
+
+    # Try Gemini SDK
+    if genai:
+        try:
+            model = _get_query_model(api_key)
+            config = {'response_mime_type': 'application/json'} if json_mode else None
+            text = model.generate_content(prompt, generation_config=config).text.strip()
+            if text:
+                return text
+        except Exception as e:
+            logger.warning(f"Gemini API query generation failed: {e}")
+
+    # Fallback to a plain HTTPS call
+    try:
+        return _gemini_rest_query(api_key, prompt, json_mode)
+    except (requests.exceptions.RequestException, KeyError, IndexError, ValueError) as e:
+        logger.warning(f"Gemini REST query generation failed: {e}")
+        return None
 
+
+_QUERY_INSTRUCTIONS = (
+    "Focus on concrete, visual concepts "
+    "(objects, scenes, settings) rather than abstract ideas. Do NOT use brand names, "
+    "proper nouns, or product names - use generic visual descriptions instead."
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _ai_search_query(title: str, topic: str, description: str) -> str:
+    """
+    Generate the AI search query for an article's title/topic/description.
+    Raises LookupError when neither the SDK nor REST produced one, so
+    failures are retried next time instead of being cached.
+    """
     prompt = (
         f"Generate a short Unsplash image search query (2-4 words) that would find "
-        f"a visually relevant photo for this article. Focus on concrete, visual concepts "
-        f"(objects, scenes, settings) rather than abstract ideas. Do NOT use brand names, "
-        f"proper nouns, or product names - use generic visual descriptions instead.\n\n"
+        f"a visually relevant photo for this article. {_QUERY_INSTRUCTIONS}\n\n"
         f"Title: {title}\n"
         f"Topic: {topic}\n"
         f"Description: {description}\n\n"
         f"Reply with ONLY the search query, nothing else."
     )
 
-    # Try Gemini API
-    if os.getenv('GOOGLE_API_KEY') and genai:
-        try:
-            genai.configure(api_key=os.getenv('GOOGLE_API_KEY'))
-            model = genai.GenerativeModel('gemini-3-flash-preview')
-            resp = model.generate_content(prompt)
-            query = resp.text.strip().strip('"').strip("'")
-            logger.info(f"  AI query: '{query}'")
-            return query
-        except Exception as e:
-            logger.warning(f"Gemini API query generation failed: {e}")
+    reply = _ask_gemini(prompt)
+    query = reply.strip('"').strip("'") if reply else ''
+    if query:
+        logger.info(f"  AI query: '{query}'")
+        return query
 
-    # Fallback to Gemini CLI
-    if _gemini_cli_path:
-        try:
-            result = subprocess.run(
-                [_gemini_cli_path, '-m', 'gemini-2.5-flash', '-p', prompt],
-                capture_output=True, text=True, timeout=30,
-            )
-            if result.returncode == 0:
-                lines = [l for l in result.stdout.strip().split('\n')
-                         if not l.startswith('Loaded cached') and not l.startswith('Hook registry')]
-                query = '\n'.join(lines).strip().strip('"').strip("'")
-                logger.info(f"  AI query (CLI): '{query}'")
-                return query
-        except Exception as e:
-            logger.warning(f"Gemini CLI query generation failed: {e}")
+    raise LookupError(title)
 
-    return None
+
+# Articles per batched query prompt
+QUERY_BATCH_SIZE = 20
+
+
+def _ai_search_queries(batch: List[tuple]) -> Dict[int, str]:
+    """AI search queries for several articles' fields in one prompt, by batch index."""
+    listing = '\n'.join(
+        f"{n}) Title: {title} | Topic: {topic} | Description: {description}"
+        for n, (title, topic, description) in enumerate(batch, 1)
+    )
+    prompt = (
+        f"For each article below, generate a short Unsplash image search query "
+        f"(2-4 words) that would find a visually relevant photo. {_QUERY_INSTRUCTIONS}\n\n"
+        f"{listing}\n\n"
+        f"Reply with a JSON array of {len(batch)} strings: the search queries, "
+        f"in the same order as the articles."
+    )
+
+    try:
+        answers = json.loads(_ask_gemini(prompt, json_mode=True) or '[]')
+    except ValueError as e:
+        logger.warning(f"Gemini returned unparseable batched queries: {e}")
+        return {}
+    # A reply of the wrong length can't be matched to articles reliably
+    if not isinstance(answers, list) or len(answers) != len(batch):
+        return {}
+    return {
+        index: query.strip()
+        for index, query in enumerate(answers)
+        if isinstance(query, str) and query.strip()
+    }
+
+
+def _build_search_queries_batch(articles: List[Dict]) -> List[str]:
+    """
+    Search queries for many articles, asking Gemini for QUERY_BATCH_SIZE at a
+    time instead of once per article. Cached answers are reused; articles the
+    batched reply misses fall back to _build_search_query.
+    """
+    fields = [_query_fields(article) for article in articles]
+    keys = [_query_cache_key(f) for f in fields]
+    queries: List[Optional[str]] = [_ai_query_cache.get(key) for key in keys]
+
+    missing = [i for i, query in enumerate(queries) if not query]
+    for start in range(0, len(missing), QUERY_BATCH_SIZE):
+        chunk = missing[start:start + QUERY_BATCH_SIZE]
+        answers = _ai_search_queries([fields[i] for i in chunk])
+        logger.info(f"  AI queries: {len(answers)}/{len(chunk)} from one batched prompt")
+        for offset, query in answers.items():
+            i = chunk[offset]
+            queries[i] = query
+            _ai_query_cache.set(keys[i], query)
+
+    return [
+        query or _build_search_query(article)
+        for query, article in zip(queries, articles)
+    ]
+
+
+_QUERY_STOP_WORDS = frozenset({
+    'a', 'an', 'the', 'is', 'are', 'was', 'were', 'be', 'has', 'had',
+    'do', 'does', 'did', 'will', 'would', 'could', 'should', 'can',
+    'may', 'might', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'into', 'its', 'it', 'this',
+    'that', 'how', 'why', 'what', 'when', 'who', 'which', 'new', 'not',
+    'no', 'vs', 'about', 'after', 'before', 'over', 'out', 'up',
+})
+_QUERY_WORD_RE = re.compile(r'[a-zA-Z0-9]+')
 
 
 def _build_search_query_fallback(article: Dict) -> str:
     """Fallback: build a search query from article title keywords."""
     title = article.get('title', '')
 
-    stop = {'a', 'an', 'the', 'is', 'are', 'was', 'were', 'be', 'has', 'had',
-            'do', 'does', 'did', 'will', 'would', 'could', 'should', 'can',
-            'may', 'might', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'into', 'its', 'it', 'this',
-            'that', 'how', 'why', 'what', 'when', 'who', 'which', 'new', 'not',
-            'no', 'vs', 'about', 'after', 'before', 'over', 'out', 'up'}
-    words = re.findall(r'[a-zA-Z0-9]+', title)
-    key_words = [w for w in words if w.lower() not in stop and len(w) > 2]
+    # Only the first three keywords are used, so stop scanning once found
+    key_words = (
+        m.group() for m in _QUERY_WORD_RE.finditer(title)
+        if len(m.group()) > 2 and m.group().lower() not in _QUERY_STOP_WORDS
+    )
 
     topic = article.get('topic', '')
-    parts = key_words[:3]
-    if topic and topic.lower() not in [p.lower() for p in parts]:
+    parts = list(itertools.islice(key_words, 3))
+    if topic and topic.lower() not in {p.lower() for p in parts}:
         parts.append(topic)
 
     return ' '.join(parts) if parts else title[:50]
@@ -272,28 +588,45 @@ def _build_search_query(article: Dict) -> str:
     return _build_search_query_fallback(article)
 
 
-def fetch_unsplash_image(query: str) -> Optional[Dict[str, str]]:
-    """Fetch a landscape image from Unsplash search API."""
-    access_key = os.getenv('UNSPLASH_ACCESS_KEY')
-    if not access_key:
-        logger.warning("UNSPLASH_ACCESS_KEY not set, skipping image fetch")
-        return None
-
+def _notify_unsplash_download(download_location: str, access_key: str) -> None:
+    """Report a photo download to Unsplash; the result is not needed."""
     try:
-        response = requests.get(
-            UNSPLASH_API_URL,
-            params={
-                'query': query,
-                'orientation': 'landscape',
-                'content_filter': 'high',
-                'per_page': 1,
-            },
-            headers={
-                'Authorization': f'Client-ID {access_key}',
-                'Accept-Version': 'v1',
-            },
-            timeout=10,
+        _unsplash_breaker.call(
+            _unsplash_session.get,
+            download_location,
+            headers={'Authorization': f'Client-ID {access_key}'},
+            timeout=5,
         )
+    except (CircuitOpenError, requests.exceptions.RequestException) as e:
+        logger.debug(f"Unsplash download event failed: {e}")
+
+
+def _search_unsplash(query: str, access_key: str) -> Optional[Dict[str, str]]:
+    """Top landscape photo for a query, including its download_location."""
+    def search():
+        _unsplash_limiter.acquire()
+        with _unsplash_slots:
+            return _unsplash_session.get(
+                UNSPLASH_API_URL,
+                params={
+                    'query': query,
+                    'orientation': 'landscape',
+                    'content_filter': 'high',
+                    'per_page': 1,
+                },
+                headers={
+                    'Authorization': f'Client-ID {access_key}',
+                    'Accept-Version': 'v1',
+                },
+                timeout=10,
+            )
+
+    try:
+        response = _unsplash_breaker.call(search)
+        # Trust Unsplash's own count when it has less quota left than the bucket
+        remaining = response.headers.get('X-Ratelimit-Remaining')
+        if remaining is not None and remaining.isdigit():
+            _unsplash_limiter.sync(int(remaining))
         response.raise_for_status()
 
         data = response.json()
@@ -307,25 +640,17 @@ def fetch_unsplash_image(query: str) -> Optional[Dict[str, str]]:
         image_url = photo['urls'].get('regular', photo['urls'].get('small', ''))
         photographer = photo.get('user', {})
 
-        # Trigger download event (Unsplash API guideline requirement)
-        download_location = photo.get('links', {}).get('download_location', '')
-        if download_location:
-            try:
-                requests.get(
-                    download_location,
-                    headers={'Authorization': f'Client-ID {access_key}'},
-                    timeout=5,
-                )
-            except Exception:
-                pass
-
         return {
             'url': image_url,
             'photographer_name': photographer.get('name', 'Unknown'),
             'photographer_url': photographer.get('links', {}).get('html', ''),
             'unsplash_url': photo.get('links', {}).get('html', ''),
+            'download_location': photo.get('links', {}).get('download_location', ''),
         }
 
+    except CircuitOpenError:
+        logger.info(f"Unsplash unavailable, skipping query '{query}'")
+        return None
     except requests.exceptions.RequestException as e:
         logger.error(f"Unsplash API request failed for query '{query}': {e}")
         return None
@@ -334,59 +659,71 @@ def fetch_unsplash_image(query: str) -> Optional[Dict[str, str]]:
         return None
 
 
+def fetch_unsplash_image(query: str) -> Optional[Dict[str, str]]:
+    """Fetch a landscape image from Unsplash search API, reusing cached searches."""
+    access_key = os.getenv('UNSPLASH_ACCESS_KEY')
+    if not access_key:
+        logger.warning("UNSPLASH_ACCESS_KEY not set, skipping image fetch")
+        return None
+
+    photo = _unsplash_cache.get(query)
+    if photo:
+        logger.info(f"  Unsplash search cached for query: {query}")
+    else:
+        photo = _search_unsplash(query, access_key)
+        if not photo:
+            return None
+        _unsplash_cache.set(query, photo)
+
+    # Trigger download event (Unsplash API guideline requirement). Sent for
+    # every use, cached search or not, so it is never served from the cache.
+    result = dict(photo)
+    download_location = result.pop('download_location', '')
+    if download_location:
+        _unsplash_bg.submit(_notify_unsplash_download, download_location, access_key)
+
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Main orchestrator: Gemini first → Unsplash fallback
 # ---------------------------------------------------------------------------
 
-def fetch_images_for_articles(articles: List[Dict]) -> List[Dict]:
+def fetch_image_for_article(article: Dict) -> Optional[str]:
     """
-    Fetch cover images for articles.
-    Priority: Gemini AI generation → Unsplash search → category thumbnail (frontend).
+    Fetch a cover image for one article, updating it in place.
+    Returns the provider that supplied the image ('gemini' / 'unsplash') or None.
     """
-    gemini_ok = 0
-    unsplash_ok = 0
-
-    for i, article in enumerate(articles):
-        if article.get('featured_image'):
-            logger.info(f"Article {i+1}/{len(articles)} already has featured image, skipping")
-            continue
-
-        title_short = article.get('title', '')[:60]
-        logger.info(f"Image {i+1}/{len(articles)}: {title_short}...")
-
-        # --- 1) Try Gemini AI image generation ---
-        gemini_url = generate_gemini_image(article)
-        if gemini_url:
-            article['featured_image'] = gemini_url
-            article['image_attribution'] = {
-                'source': 'gemini',
-                'model': 'gemini-2.5-flash-image',
-            }
-            gemini_ok += 1
-            continue
-
-        # --- 2) Fallback to Unsplash ---
-        logger.info(f"  Gemini failed, falling back to Unsplash...")
-        query = _build_search_query(article)
-        logger.info(f"  Unsplash query: '{query}'")
-
-        result = fetch_unsplash_image(query)
-        if result:
-            article['featured_image'] = result['url']
-            article['image_attribution'] = {
-                'source': 'unsplash',
-                'photographer_name': result['photographer_name'],
-                'photographer_url': result['photographer_url'],
-                'unsplash_url': result['unsplash_url'],
-            }
-            unsplash_ok += 1
-            logger.info(f"  -> Unsplash image by {result['photographer_name']}")
-        else:
-            logger.info(f"  -> No image found, article will use category thumbnail")
-
-        if i < len(articles) - 1:
-            time.sleep(1.0)
-
-    logger.info(f"Image summary: {gemini_ok} AI-generated, {unsplash_ok} Unsplash, "
-                f"{len(articles) - gemini_ok - unsplash_ok} no image")
-    return articles
+    title_short = article.get('title', '')[:60]
+    logger.info(f"Image: {title_short}...")
+
+    # --- 1) Try Gemini AI image generation ---
+    gemini_url = generate_gemini_image(article)
+    if gemini_url:
+        article['featured_image'] = gemini_url
+        article['image_attribution'] = {
+            'source': 'gemini',
+            'model': 'gemini-2.5-flash-image',
+        }
+        return 'gemini'
+
+    # --- 2) Fallback to Unsplash ---
+    logger.info(f"  Gemini failed for '{title_short}', falling back to Unsplash...")
+    query = _build_search_query(article)
+    logger.info(f"  Unsplash query: '{query}'")
+
+    result = fetch_unsplash_image(query)
+    if result:
+        article['featured_image'] = result['url']
+        article['image_attribution'] = {
+            'source': 'unsplash',
+            'photographer_name': result['photographer_name'],
+            'photographer_url': result['photographer_url'],
+            'unsplash_url': result['unsplash_url'],
+        }
+        logger.info(f"  -> Unsplash image by {result['photographer_name']}")
+        return 'unsplash'
+
+    logger.info(f"  -> No image found for '{title_short}', article will use category thumbnail")
+    return None
+
@@ -11,16 +11,35 @@ Collects trending topics from multiple sources:
 - NewsAPI
 """
 
+import base64
+import bisect
+import hashlib
+import itertools
+import json
 import logging
 import os
 import re
-import xml.etree.ElementTree as ET
-from typing import List, Dict
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Iterator, List, Dict, Optional
 from datetime import datetime
 
 import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from scripts.circuit_breaker import CircuitBreaker, CircuitOpenError
+from scripts.disk_cache import DiskCache
+
 load_dotenv()
 
 # Configure logging
@@ -30,6 +49,170 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Source JSON is decoded from response bytes, with orjson when it is installed
+_json_loads = orjson.loads if orjson else json.loads
+
+# HackerNews item requests in flight at once
+HN_WORKERS = 10
+
+# Hosts with many calls per run stop being called after repeated connection
+# failures, instead of paying the full timeout on every remaining request
+_hn_breaker = CircuitBreaker('HackerNews', fail_max=5, reset_timeout=30)
+_trends_breaker = CircuitBreaker('Google Trends', fail_max=3, reset_timeout=60)
+
+# Keep-alive session shared by every fetcher, so repeated calls to the same
+# host (HN items, Trends markets, RSS feeds) reuse their TLS connections
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+
+def _parse_feed(content: bytes):
+    """
+    Parse RSS/Atom bytes with lxml, tolerating malformed markup. Each call
+    gets its own parser since feeds are parsed on several threads at once.
+    """
+    root = etree.fromstring(content, etree.XMLParser(recover=True))
+    if root is None:
+        raise ValueError("empty or unparseable feed")
+    return root
+
+
+def _iter_item_titles(stream) -> Iterator[Optional[str]]:
+    """
+    Yield the text of each RSS <item><title> as the feed is parsed, clearing
+    finished items so memory stays flat however long the feed is.
+    """
+    depth = 0
+    item_depth = None
+    for event, elem in etree.iterparse(stream, events=('start', 'end'), recover=True):
+        if event == 'start':
+            depth += 1
+            if elem.tag == 'item' and item_depth is None:
+                item_depth = depth
+            continue
+
+        if elem.tag == 'title' and item_depth is not None and depth == item_depth + 1:
+            yield elem.text
+        elif elem.tag == 'item' and depth == item_depth:
+            item_depth = None
+            # Drop the finished item and its already-processed siblings
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        depth -= 1
+
+
+# Source responses are reused for SOURCE_CACHE_TTL seconds, and served
+# stale for up to SOURCE_STALE_TTL when the source is failing
+SOURCE_CACHE_TTL = 5 * 60
+SOURCE_STALE_TTL = 60 * 60
+_response_cache = DiskCache('trending_responses', ttl=SOURCE_STALE_TTL)
+
+
+def _get_content(url: str, **kwargs) -> bytes:
+    """GET a source URL's body through the response cache; raises if it fails with nothing cached."""
+    request_id = f"{url}?{sorted((kwargs.get('params') or {}).items())}"
+    key = hashlib.blake2b(request_id.encode('utf-8'), digest_size=16).hexdigest()
+    cached = _response_cache.get(key)
+    if cached and time.time() - cached['fetched_at'] < SOURCE_CACHE_TTL:
+        return base64.b64decode(cached['body'])
+
+    try:
+        response = _session.get(url, **kwargs)
+        response.raise_for_status()
+    except Exception as e:
+        if not cached:
+            raise
+        logger.warning(f"{url} failed, using cached response: {str(e)}")
+        return base64.b64decode(cached['body'])
+
+    _response_cache.set(key, {
+        'fetched_at': time.time(),
+        'body': base64.b64encode(response.content).decode('ascii'),
+    })
+    return response.content
+
+
+# Google Trends daily trends API (no auth needed)
+DAILY_TRENDS_URL = "https://trends.google.com/trending/rss?geo={geo}"
+
+# Parsed feed titles per market: reused outright while fresh, revalidated with
+# ETag / Last-Modified afterwards, and served stale if Google is unreachable
+TRENDS_FRESH_SECONDS = 15 * 60
+_trends_cache = DiskCache('google_trends', ttl=24 * 3600)
+
+
+def _fetch_market_titles(market: str, limit: int) -> List[Optional[str]]:
+    """First `limit` item titles of a market's Trends feed, using the feed cache."""
+    key = f'{market}:{limit}'
+    cached = _trends_cache.get(key)
+    if cached and time.time() - cached['fetched_at'] < TRENDS_FRESH_SECONDS:
+        return cached['titles']
+
+    headers = {'User-Agent': 'Mozilla/5.0'}
+    if cached and cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached and cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
+
+    try:
+        with _trends_breaker.call(
+            _session.get,
+            DAILY_TRENDS_URL.format(geo=market),
+            headers=headers,
+            timeout=15,
+            stream=True,
+        ) as resp:
+            if resp.status_code == 304 and cached:
+                titles = cached['titles']
+            else:
+                resp.raise_for_status()
+                # Parse RSS titles straight off the socket, stopping after `limit` items
+                resp.raw.decode_content = True
+                titles = list(itertools.islice(_iter_item_titles(resp.raw), limit))
+            etag = resp.headers.get('ETag') or (cached or {}).get('etag')
+            last_modified = resp.headers.get('Last-Modified') or (cached or {}).get('last_modified')
+    except Exception as e:
+        if not cached:
+            raise
+        logger.warning(f"Google Trends failed for {market}, using cached feed: {str(e)}")
+        return cached['titles']
+
+    _trends_cache.set(key, {
+        'fetched_at': time.time(),
+        'etag': etag,
+        'last_modified': last_modified,
+        'titles': titles,
+    })
+    return titles
+
+
+def _fetch_trends_market(market: str, limit: int) -> List[Dict]:
+    """Fetch one market's Google Trends; failures are logged and yield no trends."""
+    trends_list = []
+    timestamp = datetime.now().isoformat()  # shared by every trend in this fetch
+    try:
+        for idx, keyword in enumerate(_fetch_market_titles(market, limit)):
+            if keyword and len(keyword.split()) >= 3:
+                trends_list.append({
+                    'keyword': keyword,
+                    'source': 'google_trends',
+                    'score': limit - idx,
+                    'region': market,
+                    'timestamp': timestamp,
+                })
+
+        logger.info(f"Fetched {len(trends_list)} trends from Google Trends ({market})")
+
+    except Exception as e:
+        logger.warning(f"Google Trends failed for {market}: {str(e)}")
+
+    return trends_list
+
 
 def fetch_google_trends(
     markets: List[str] = ['US', 'UK', 'CA', 'DE', 'FR'],
@@ -38,6 +221,7 @@ def fetch_google_trends(
     """
     Fetch trending searches from Google Trends using the daily trends RSS/JSON API.
     Does not depend on pytrends to avoid urllib3 compatibility issues.
+    Markets are fetched concurrently.
 
     Args:
         markets: List of country codes (e.g., ['US', 'UK', 'CA'])
@@ -49,49 +233,89 @@ def fetch_google_trends(
     logger.info(f"Fetching Google Trends for markets: {markets}")
     trends_list = []
 
-    # Google Trends daily trends API (no auth needed)
-    DAILY_TRENDS_URL = "https://trends.google.com/trending/rss?geo={geo}"
+    if markets:
+        with ThreadPoolExecutor(max_workers=len(markets)) as executor:
+            # map keeps market order in the combined list
+            for market_trends in executor.map(lambda m: _fetch_trends_market(m, limit), markets):
+                trends_list.extend(market_trends)
 
-    for market in markets:
-        try:
-            resp = requests.get(
-                DAILY_TRENDS_URL.format(geo=market),
-                headers={'User-Agent': 'Mozilla/5.0'},
-                timeout=15,
-            )
-            resp.raise_for_status()
-
-            # Parse RSS XML for titles
-            import xml.etree.ElementTree as ET
-            root = ET.fromstring(resp.text)
-            items = root.findall('.//item/title')
-
-            count = 0
-            for idx, item in enumerate(items[:limit]):
-                keyword = item.text
-                if keyword and len(keyword.split()) >= 3:
-                    trends_list.append({
-                        'keyword': keyword,
-                        'source': 'google_trends',
-                        'score': limit - idx,
-                        'region': market,
-                        'timestamp': datetime.now().isoformat(),
-                    })
-                    count += 1
-
-            logger.info(f"Fetched {count} trends from Google Trends ({market})")
+    logger.info(f"Total trends fetched from Google: {len(trends_list)}")
+    return trends_list
 
-        except Exception as e:
-            logger.warning(f"Google Trends failed for {market}: {str(e)}")
-            continue
 
-    logger.info(f"Total trends fetched from Google: {len(trends_list)}")
+def _fetch_hn_item(story_id: int) -> Optional[Dict]:
+    """Fetch one HackerNews item, or None if the request fails."""
+    try:
+        response = _hn_breaker.call(
+            _session.get,
+            f'https://hacker-news.firebaseio.com/v0/item/{story_id}.json',
+            timeout=10
+        )
+        response.raise_for_status()
+        return _json_loads(response.content)
+    except CircuitOpenError:
+        return None
+    except Exception as e:
+        logger.error(f"Error fetching HN story {story_id}: {str(e)}")
+        return None
+
+
+def _fetch_hn_algolia(limit: int, timestamp: str) -> List[Dict]:
+    """Front-page stories from the Algolia HN API, full records in one request."""
+    content = _get_content(
+        'https://hn.algolia.com/api/v1/search',
+        params={'tags': 'front_page', 'hitsPerPage': limit},
+        timeout=10,
+    )
+    trends_list = []
+    for hit in _json_loads(content).get('hits', []):
+        if hit.get('title'):
+            trends_list.append({
+                'keyword': hit['title'],
+                'source': 'hackernews',
+                'score': hit.get('points') or 0,
+                'region': 'global',
+                'url': hit.get('url') or f"https://news.ycombinator.com/item?id={hit['objectID']}",
+                'timestamp': timestamp
+            })
+    return trends_list
+
+
+def _fetch_hn_firebase(limit: int, timestamp: str) -> List[Dict]:
+    """Top stories from the official Firebase API: the ID list, then each item."""
+    # Get top story IDs
+    content = _hn_breaker.call(
+        _get_content,
+        'https://hacker-news.firebaseio.com/v0/topstories.json',
+        timeout=10
+    )
+    story_ids = _json_loads(content)[:limit]
+
+    # Fetch story details concurrently, keeping topstories order
+    if story_ids:
+        with ThreadPoolExecutor(max_workers=min(len(story_ids), HN_WORKERS)) as executor:
+            stories = list(executor.map(_fetch_hn_item, story_ids))
+    else:
+        stories = []
+
+    trends_list = []
+    for story_id, story in zip(story_ids, stories):
+        if story and 'title' in story:
+            trends_list.append({
+                'keyword': story['title'],
+                'source': 'hackernews',
+                'score': story.get('score', 0),
+                'region': 'global',
+                'url': story.get('url', f'https://news.ycombinator.com/item?id={story_id}'),
+                'timestamp': timestamp
+            })
     return trends_list
 
 
 def fetch_hackernews_top(limit: int = 10) -> List[Dict]:
     """
     Fetch top stories from HackerNews.
+    Uses the Algolia HN API (one request), falling back to the Firebase API.
 
     Args:
         limit: Number of stories to fetch
@@ -101,39 +325,14 @@ def fetch_hackernews_top(limit: int = 10) -> List[Dict]:
     """
     logger.info(f"Fetching top {limit} HackerNews stories")
     trends_list = []
+    timestamp = datetime.now().isoformat()
 
     try:
-        # Get top story IDs
-        response = requests.get(
-            'https://hacker-news.firebaseio.com/v0/topstories.json',
-            timeout=10
-        )
-        response.raise_for_status()
-        story_ids = response.json()[:limit]
-
-        # Fetch story details
-        for idx, story_id in enumerate(story_ids):
-            try:
-                story_response = requests.get(
-                    f'https://hacker-news.firebaseio.com/v0/item/{story_id}.json',
-                    timeout=10
-                )
-                story_response.raise_for_status()
-                story = story_response.json()
-
-                if story and 'title' in story:
-                    trends_list.append({
-                        'keyword': story['title'],
-                        'source': 'hackernews',
-                        'score': story.get('score', 0),
-                        'region': 'global',
-                        'url': story.get('url', f'https://news.ycombinator.com/item?id={story_id}'),
-                        'timestamp': datetime.now().isoformat()
-                    })
-
-            except Exception as e:
-                logger.error(f"Error fetching HN story {story_id}: {str(e)}")
-                continue
+        try:
+            trends_list = _fetch_hn_algolia(limit, timestamp)
+        except Exception as e:
+            logger.warning(f"Algolia HN search failed, using Firebase API: {str(e)}")
+            trends_list = _fetch_hn_firebase(limit, timestamp)
 
         logger.info(f"Fetched {len(trends_list)} stories from HackerNews")
 
@@ -147,16 +346,16 @@ def fetch_devto_trending(limit: int = 10) -> List[Dict]:
     """Fetch trending articles from Dev.to."""
     logger.info(f"Fetching top {limit} Dev.to articles")
     trends_list = []
+    timestamp = datetime.now().isoformat()
 
     try:
-        response = requests.get(
+        content = _get_content(
             'https://dev.to/api/articles',
             params={'top': 1, 'per_page': limit},
             headers={'User-Agent': 'NexusTopic/1.0'},
             timeout=10,
         )
-        response.raise_for_status()
-        articles = response.json()
+        articles = _json_loads(content)
 
         for article in articles:
             trends_list.append({
@@ -165,7 +364,7 @@ def fetch_devto_trending(limit: int = 10) -> List[Dict]:
                 'score': article.get('public_reactions_count', 0),
                 'region': 'global',
                 'url': article.get('url', ''),
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
             })
 
         logger.info(f"Fetched {len(trends_list)} articles from Dev.to")
@@ -180,20 +379,19 @@ def fetch_producthunt(limit: int = 10) -> List[Dict]:
     """Fetch today's top products from Product Hunt via Atom feed."""
     logger.info(f"Fetching top {limit} Product Hunt items")
     trends_list = []
+    timestamp = datetime.now().isoformat()
     atom_ns = '{http://www.w3.org/2005/Atom}'
 
     try:
-        response = requests.get(
+        content = _get_content(
             'https://www.producthunt.com/feed',
             headers={'User-Agent': 'Mozilla/5.0'},
             timeout=15,
         )
-        response.raise_for_status()
-
-        root = ET.fromstring(response.text)
-        entries = root.findall(f'{atom_ns}entry')
+        root = _parse_feed(content)
+        entries = itertools.islice(root.iterfind(f'{atom_ns}entry'), limit)
 
-        for idx, entry in enumerate(entries[:limit]):
+        for idx, entry in enumerate(entries):
             title = entry.find(f'{atom_ns}title')
             link = entry.find(f'{atom_ns}link')
             if title is not None and title.text:
@@ -204,7 +402,7 @@ def fetch_producthunt(limit: int = 10) -> List[Dict]:
                     'score': limit - idx,
                     'region': 'global',
                     'url': link_url,
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': timestamp,
                 })
 
         logger.info(f"Fetched {len(trends_list)} items from Product Hunt")
@@ -215,59 +413,69 @@ def fetch_producthunt(limit: int = 10) -> List[Dict]:
     return trends_list
 
 
-def fetch_tech_rss(limit: int = 10) -> List[Dict]:
-    """Fetch latest articles from TechCrunch and The Verge via RSS."""
-    logger.info("Fetching TechCrunch + The Verge RSS")
+# Tech news feeds polled by fetch_tech_rss, as (url, source name)
+TECH_RSS_FEEDS = [
+    ('https://techcrunch.com/feed/', 'techcrunch'),
+    ('https://www.theverge.com/rss/index.xml', 'theverge'),
+]
+
+
+def _fetch_rss_feed(feed_url: str, source_name: str, limit: int) -> List[Dict]:
+    """Fetch one RSS/Atom feed; failures are logged and yield no trends."""
     trends_list = []
+    timestamp = datetime.now().isoformat()
+    try:
+        content = _get_content(
+            feed_url,
+            headers={'User-Agent': 'Mozilla/5.0'},
+            timeout=15,
+        )
+        root = _parse_feed(content)
+        # Handle both RSS <item> and Atom <entry>
+        if root.find('.//{http://www.w3.org/2005/Atom}entry') is not None:
+            items = root.iterfind('.//{http://www.w3.org/2005/Atom}entry')
+        else:
+            items = root.iterfind('.//item')
+
+        for idx, item in enumerate(itertools.islice(items, limit)):
+            # Try Atom <title> then RSS <title>
+            title = item.find('{http://www.w3.org/2005/Atom}title')
+            if title is None:
+                title = item.find('title')
+            link = item.find('{http://www.w3.org/2005/Atom}link')
+            if link is None:
+                link = item.find('link')
 
-    feeds = [
-        ('https://techcrunch.com/feed/', 'techcrunch'),
-        ('https://www.theverge.com/rss/index.xml', 'theverge'),
-    ]
+            if title is not None and title.text:
+                link_url = ''
+                if link is not None:
+                    link_url = link.get('href', '') or link.text or ''
 
-    for feed_url, source_name in feeds:
-        try:
-            response = requests.get(
-                feed_url,
-                headers={'User-Agent': 'Mozilla/5.0'},
-                timeout=15,
-            )
-            response.raise_for_status()
-
-            root = ET.fromstring(response.text)
-            # Handle both RSS <item> and Atom <entry>
-            items = root.findall('.//{http://www.w3.org/2005/Atom}entry') or root.findall('.//item')
-
-            count = 0
-            for idx, item in enumerate(items[:limit]):
-                # Try Atom <title> then RSS <title>
-                title = item.find('{http://www.w3.org/2005/Atom}title')
-                if title is None:
-                    title = item.find('title')
-                link = item.find('{http://www.w3.org/2005/Atom}link')
-                if link is None:
-                    link = item.find('link')
-
-                if title is not None and title.text:
-                    link_url = ''
-                    if link is not None:
-                        link_url = link.get('href', '') or link.text or ''
-
-                    trends_list.append({
-                        'keyword': title.text.strip(),
-                        'source': source_name,
-                        'score': limit - idx,
-                        'region': 'global',
-                        'url': link_url,
-                        'timestamp': datetime.now().isoformat(),
-                    })
-                    count += 1
-
-            logger.info(f"Fetched {count} articles from {source_name}")
+                trends_list.append({
+                    'keyword': title.text.strip(),
+                    'source': source_name,
+                    'score': limit - idx,
+                    'region': 'global',
+                    'url': link_url,
+                    'timestamp': timestamp,
+                })
 
-        except Exception as e:
-            logger.warning(f"{source_name} RSS fetch failed: {str(e)}")
-            continue
+        logger.info(f"Fetched {len(trends_list)} articles from {source_name}")
+
+    except Exception as e:
+        logger.warning(f"{source_name} RSS fetch failed: {str(e)}")
+
+    return trends_list
+
+
+def fetch_tech_rss(limit: int = 10) -> List[Dict]:
+    """Fetch latest articles from TechCrunch and The Verge via RSS, concurrently."""
+    logger.info("Fetching TechCrunch + The Verge RSS")
+    trends_list = []
+
+    with ThreadPoolExecutor(max_workers=len(TECH_RSS_FEEDS)) as executor:
+        for feed_trends in executor.map(lambda feed: _fetch_rss_feed(*feed, limit), TECH_RSS_FEEDS):
+            trends_list.extend(feed_trends)
 
     return trends_list
 
@@ -281,9 +489,10 @@ def fetch_newsapi(limit: int = 10) -> List[Dict]:
 
     logger.info(f"Fetching top {limit} NewsAPI headlines")
     trends_list = []
+    timestamp = datetime.now().isoformat()
 
     try:
-        response = requests.get(
+        content = _get_content(
             'https://newsapi.org/v2/top-headlines',
             params={
                 'category': 'technology',
@@ -293,8 +502,7 @@ def fetch_newsapi(limit: int = 10) -> List[Dict]:
             },
             timeout=10,
         )
-        response.raise_for_status()
-        data = response.json()
+        data = _json_loads(content)
 
         for idx, article in enumerate(data.get('articles', [])):
             title = article.get('title', '')
@@ -305,7 +513,7 @@ def fetch_newsapi(limit: int = 10) -> List[Dict]:
                     'score': limit - idx,
                     'region': 'global',
                     'url': article.get('url', ''),
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': timestamp,
                 })
 
         logger.info(f"Fetched {len(trends_list)} headlines from NewsAPI")
@@ -316,6 +524,106 @@ def fetch_newsapi(limit: int = 10) -> List[Dict]:
     return trends_list
 
 
+# Category keywords whose trends earn a score boost
+HIGH_CPC_KEYWORDS = [
+    # Finance & Insurance
+    'insurance', 'mortgage', 'credit', 'loan', 'banking', 'invest', 'stock', 'crypto',
+    'bitcoin', 'ethereum', 'finance', 'tax', 'trading', 'hedge fund', 'interest rate',
+    'federal reserve', 'inflation', 'recession', 'economy', 'GDP', 'earnings',
+    # Legal
+    'lawsuit', 'regulation', 'compliance', 'patent', 'antitrust', 'court', 'legal',
+    'privacy', 'GDPR', 'settlement',
+    # Health & Pharma
+    'health', 'medical', 'pharma', 'drug', 'FDA', 'clinical trial', 'vaccine',
+    'healthcare', 'biotech', 'cancer', 'disease', 'therapy',
+    # AI & SaaS & Tech Enterprise
+    'artificial intelligence', ' AI ', 'machine learning', 'SaaS', 'cloud', 'enterprise',
+    'cybersecurity', 'data breach', 'ransomware', 'startup', 'valuation', 'IPO',
+    'acquisition', 'merger', 'funding', 'venture capital',
+    # Real Estate
+    'real estate', 'housing', 'property', 'rent', 'construction',
+    # Energy
+    'oil', 'energy', 'solar', 'EV ', 'electric vehicle', 'battery', 'nuclear',
+]
+# One pass over each lowercased trend keyword. Matches must start at a word
+# boundary, so 'ai' no longer hits "email" or 'rent' hits "current", while
+# stems still cover inflections ('invest' -> "investment"). Keywords written
+# with surrounding spaces (' AI ', 'EV ') must also end at a word boundary.
+# Longest alternatives come first so 'healthcare' wins over 'health'.
+_CPC_PATTERN = re.compile(r'\b(?:' + '|'.join(sorted(
+    {re.escape(kw.strip().lower()) + (r'\b' if kw != kw.strip() else '') for kw in HIGH_CPC_KEYWORDS},
+    key=len, reverse=True,
+)) + ')')
+
+# Byte table turning everything except [a-z0-9] into a space, so a split
+# tokenizes like re.findall(r'[a-z0-9]+') at a fraction of the cost
+_NON_WORD_BYTES = bytes(b for b in range(256) if not (97 <= b <= 122 or 48 <= b <= 57))
+_WORD_SEPARATORS = bytes.maketrans(_NON_WORD_BYTES, b' ' * len(_NON_WORD_BYTES))
+
+
+def _significant_words(text_lower: str) -> frozenset:
+    """Words longer than two characters in an already-lowercased keyword, as ASCII bytes."""
+    # Non-ASCII characters become '?', which the table then turns into a separator
+    ascii_text = text_lower.encode('ascii', 'replace').translate(_WORD_SEPARATORS)
+    return frozenset(w for w in ascii_text.split() if len(w) > 2)
+
+
+def _dedupe_trends(trends: List[Dict]) -> List[Dict]:
+    """
+    Drop near-duplicate trends, keeping the first of each group.
+
+    A trend is a duplicate when its keyword contains, or is contained in, a
+    kept keyword, or when their significant words have Jaccard similarity
+    >= 0.5. Word sets are built once per trend, and an inverted index limits
+    the Jaccard check to kept trends sharing at least one word. Substring
+    checks scan one joined string of kept keywords, and only test kept
+    keywords short enough to fit inside the new one.
+    """
+    unique = []
+    kept_words = []
+    postings = defaultdict(list)  # word -> indices into unique
+    kept_haystack = ''            # kept keywords joined by '\0'
+    kept_lengths = []             # kept keyword lengths, ascending
+    kept_by_length = []           # kept keywords in the same order
+
+    for trend in trends:
+        keyword_lower = trend['keyword'].lower()
+        # Exact and substring matches
+        if unique and keyword_lower in kept_haystack:
+            continue
+        fits = bisect.bisect_right(kept_lengths, len(keyword_lower))
+        if any(existing in keyword_lower for existing in itertools.islice(kept_by_length, fits)):
+            continue
+
+        words = _significant_words(keyword_lower)
+        candidates = {i for w in words for i in postings.get(w, ())}
+        if any(len(words & kept_words[i]) / len(words | kept_words[i]) >= 0.5 for i in candidates):
+            continue
+
+        for w in words:
+            postings[w].append(len(unique))
+        unique.append(trend)
+        kept_words.append(words)
+        kept_haystack += '\0' + keyword_lower
+        position = bisect.bisect_right(kept_lengths, len(keyword_lower))
+        kept_lengths.insert(position, len(keyword_lower))
+        kept_by_length.insert(position, keyword_lower)
+
+    return unique
+
+
+def _normalize_scores(trends: List[Dict]) -> None:
+    """Rescale a source's scores in place so its top trend scores 100."""
+    if not trends:
+        return
+    max_score = max(t['score'] for t in trends) or 1
+    if max_score == 100:
+        # Already on the 0-100 scale; rescaling would reproduce the same ints
+        return
+    for t in trends:
+        t['score'] = round((t['score'] / max_score) * 100)
+
+
 def get_all_trending_topics(
     markets: List[str] = ['US', 'UK', 'CA'],
     subreddits: List[str] = None,
@@ -336,63 +644,31 @@ def get_all_trending_topics(
 
     all_trends = []
 
-    hn_trends = fetch_hackernews_top(limit=limit_per_source)
-    google_trends = fetch_google_trends(markets=markets, limit=limit_per_source)
-    devto_trends = fetch_devto_trending(limit=limit_per_source)
-    ph_trends = fetch_producthunt(limit=limit_per_source)
-    rss_trends = fetch_tech_rss(limit=limit_per_source)
-    newsapi_trends = fetch_newsapi(limit=limit_per_source)
-
-    # Normalize scores to 0-100 scale so different sources are comparable
-    def _normalize(trends: list) -> list:
-        if not trends:
-            return trends
-        scores = [t['score'] for t in trends]
-        max_score = max(scores) or 1
-        for t in trends:
-            t['score'] = round((t['score'] / max_score) * 100)
-        return trends
-
-    _normalize(hn_trends)
-    _normalize(google_trends)
-    _normalize(devto_trends)
-    _normalize(ph_trends)
-    _normalize(rss_trends)
-    _normalize(newsapi_trends)
-
-    # Combine all sources
-    all_trends.extend(hn_trends)
-    all_trends.extend(google_trends)
-    all_trends.extend(devto_trends)
-    all_trends.extend(ph_trends)
-    all_trends.extend(rss_trends)
-    all_trends.extend(newsapi_trends)
+    # Sources are independent, so total latency is that of the slowest one
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        hn_future = executor.submit(fetch_hackernews_top, limit=limit_per_source)
+        google_future = executor.submit(fetch_google_trends, markets=markets, limit=limit_per_source)
+        devto_future = executor.submit(fetch_devto_trending, limit=limit_per_source)
+        ph_future = executor.submit(fetch_producthunt, limit=limit_per_source)
+        rss_future = executor.submit(fetch_tech_rss, limit=limit_per_source)
+        newsapi_future = executor.submit(fetch_newsapi, limit=limit_per_source)
+
+    hn_trends = hn_future.result()
+    google_trends = google_future.result()
+    devto_trends = devto_future.result()
+    ph_trends = ph_future.result()
+    rss_trends = rss_future.result()
+    newsapi_trends = newsapi_future.result()
+
+    # Normalize each source to 0-100 so they are comparable, then combine
+    for trends in (hn_trends, google_trends, devto_trends, ph_trends, rss_trends, newsapi_trends):
+        _normalize_scores(trends)
+        all_trends.extend(trends)
 
     # Boost high-CPC category keywords (finance, insurance, legal, health, AI/SaaS, real estate)
-    HIGH_CPC_KEYWORDS = [
-        # Finance & Insurance
-        'insurance', 'mortgage', 'credit', 'loan', 'banking', 'invest', 'stock', 'crypto',
-        'bitcoin', 'ethereum', 'finance', 'tax', 'trading', 'hedge fund', 'interest rate',
-        'federal reserve', 'inflation', 'recession', 'economy', 'GDP', 'earnings',
-        # Legal
-        'lawsuit', 'regulation', 'compliance', 'patent', 'antitrust', 'court', 'legal',
-        'privacy', 'GDPR', 'settlement',
-        # Health & Pharma
-        'health', 'medical', 'pharma', 'drug', 'FDA', 'clinical trial', 'vaccine',
-        'healthcare', 'biotech', 'cancer', 'disease', 'therapy',
-        # AI & SaaS & Tech Enterprise
-        'artificial intelligence', ' AI ', 'machine learning', 'SaaS', 'cloud', 'enterprise',
-        'cybersecurity', 'data breach', 'ransomware', 'startup', 'valuation', 'IPO',
-        'acquisition', 'merger', 'funding', 'venture capital',
-        # Real Estate
-        'real estate', 'housing', 'property', 'rent', 'construction',
-        # Energy
-        'oil', 'energy', 'solar', 'EV ', 'electric vehicle', 'battery', 'nuclear',
-    ]
-
     for trend in all_trends:
         keyword_lower = trend['keyword'].lower()
-        cpc_matches = sum(1 for kw in HIGH_CPC_KEYWORDS if kw.lower().strip() in keyword_lower)
+        cpc_matches = len(set(_CPC_PATTERN.findall(keyword_lower)))
         if cpc_matches > 0:
             # Boost score by 50% per matching CPC keyword, cap at 3x
             multiplier = min(1.0 + (0.5 * cpc_matches), 3.0)
@@ -400,33 +676,10 @@ def get_all_trending_topics(
             trend['cpc_boost'] = True
 
     # Sort by boosted score (descending)
-    all_trends.sort(key=lambda x: x['score'], reverse=True)
+    all_trends.sort(key=itemgetter('score'), reverse=True)
 
-    # Remove duplicates (keep highest score) - word overlap similarity check
-    unique_trends = []
-    for trend in all_trends:
-        keyword_lower = trend['keyword'].lower()
-        is_dup = False
-        for existing in unique_trends:
-            existing_lower = existing['keyword'].lower()
-            # Exact match
-            if keyword_lower == existing_lower:
-                is_dup = True
-                break
-            # Substring match
-            if keyword_lower in existing_lower or existing_lower in keyword_lower:
-                is_dup = True
-                break
-            # Word overlap: extract significant words (>2 chars) and check Jaccard similarity
-            words_a = {w for w in re.findall(r'[a-z0-9]+', keyword_lower) if len(w) > 2}
-            words_b = {w for w in re.findall(r'[a-z0-9]+', existing_lower) if len(w) > 2}
-            if words_a and words_b:
-                overlap = len(words_a & words_b) / len(words_a | words_b)
-                if overlap >= 0.5:
-                    is_dup = True
-                    break
-        if not is_dup:
-            unique_trends.append(trend)
+    # Remove duplicates (keep highest score)
+    unique_trends = _dedupe_trends(all_trends)
 
     logger.info(f"Total trending topics collected: {len(unique_trends)} (from {len(all_trends)} raw)")
     logger.info(f"Sources: HackerNews={len(hn_trends)}, Google={len(google_trends)}, "
@@ -455,5 +708,5 @@ if __name__ == "__main__":
         markets=['US'],
         limit_per_source=3
     )
-    for trend in all_results[:10]:
+    for trend in itertools.islice(all_results, 10):
         print(f"  - {trend['keyword'][:60]}... (Source: {trend['source']}, Score: {trend['score']})")
@@ -12,7 +12,9 @@ import re
 import subprocess
 import shutil
 import time
-from typing import Dict, Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, Optional
 from datetime import datetime
 
 try:
@@ -46,18 +48,18 @@ _STOPWORDS = frozenset([
     'he', 'she', 'his', 'her', 'my', 'me', 'up', 'out', 'new',
 ])
 
-# Gemini CLI path (cached)
-_gemini_cli_path = shutil.which('gemini')
+# Gemini CLI path, resolved once at import (None when not installed)
+GEMINI_CLI_PATH = shutil.which('gemini')
 
 
 def _generate_with_gemini_cli(prompt: str, model: str = "gemini-2.5-pro") -> str:
     """Generate content using Gemini CLI (uses Google account auth, no API quota)."""
-    if not _gemini_cli_path:
+    if not GEMINI_CLI_PATH:
         raise RuntimeError("Gemini CLI not installed")
 
     logger.info(f"Calling Gemini CLI ({model})...")
     result = subprocess.run(
-        [_gemini_cli_path, '-m', model, '-p', prompt],
+        [GEMINI_CLI_PATH, '-m', model, '-p', prompt],
         capture_output=True,
         text=True,
         timeout=180,
@@ -163,7 +165,7 @@ def calculate_reading_time(text: str, words_per_minute: int = 200) -> int:
     return reading_time
 
 
-STOP_WORDS = {
+STOP_WORDS = frozenset({
     'this', 'that', 'with', 'from', 'which', 'their', 'there', 'these',
     'those', 'then', 'than', 'them', 'they', 'been', 'being', 'were',
     'have', 'having', 'does', 'doing', 'done', 'will', 'would', 'could',
@@ -205,23 +207,22 @@ STOP_WORDS = {
     'type', 'types', 'understanding', 'without',
     'adsbygoogle', 'window', 'push', 'pagead', 'script', 'class',
     'style', 'href', 'http', 'https', 'data', 'content', 'users',
-}
+})
 
 
-def extract_keywords(content: str, max_keywords: int = 10) -> list:
-    """Extract meaningful keywords from content, filtering stop words."""
-    clean_text = re.sub(r'<[^>]+>', '', content)
-    words = re.findall(r'\b[a-z]{4,}\b', clean_text.lower())
-
-    word_freq = {}
-    for word in words:
-        if word not in STOP_WORDS:
-            word_freq[word] = word_freq.get(word, 0) + 1
+_TAG_RE = re.compile(r'<[^>]+>')
+_WORD_RE = re.compile(r'\b[a-z]{4,}\b')
 
-    sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-    keywords = [word for word, freq in sorted_words[:max_keywords]]
 
-    return keywords
+def extract_keywords(content: str, max_keywords: int = 10) -> list:
+    """Extract meaningful keywords from content, filtering stop words."""
+    # Count every word in one C-level pass, then drop the stop words present;
+    # cheaper than filtering word-by-word, and faster than folding the stop
+    # words into the regex as a negative-lookahead alternation
+    word_freq = Counter(_WORD_RE.findall(_TAG_RE.sub('', content).lower()))
+    for word in STOP_WORDS.intersection(word_freq):
+        del word_freq[word]
+    return [word for word, freq in word_freq.most_common(max_keywords)]
 
 
 VALID_CATEGORIES = [
@@ -421,7 +422,7 @@ def generate_article(
         return None
 
     # Primary: Gemini CLI (gemini-2.5-pro, Google account auth)
-    if _gemini_cli_path:
+    if GEMINI_CLI_PATH:
         try:
             article = _try_generate('Gemini CLI', lambda: _generate_with_gemini_cli(prompt))
             if article:
@@ -455,12 +456,21 @@ def generate_article(
     return {}
 
 
-def generate_multiple_articles(
+def iter_generated_articles(
     topics: list,
     articles_count: int = 3,
+    concurrency: int = 4,
     **kwargs
-) -> list:
-    """Generate multiple articles from a list of topics with duplicate checking."""
+) -> Iterator[Dict]:
+    """
+    Generate articles from a list of topics with duplicate checking,
+    yielding each accepted article as soon as it is ready.
+
+    Non-duplicate topics are picked in batches and each batch is generated
+    concurrently (up to `concurrency` LLM calls in flight). Articles are
+    yielded in topic order, so one finishing early waits only for the
+    topics picked before it, not for the whole batch.
+    """
     logger.info(f"Generating {articles_count} articles from {len(topics)} topics")
 
     # Get existing articles and trending keywords to avoid duplicates
@@ -499,79 +509,102 @@ def generate_multiple_articles(
     except Exception as e:
         logger.warning(f"Could not load local articles index: {str(e)}")
 
-    articles = []
+    generated_count = 0
     used_topics = set()
     topic_index = 0
 
-    while len(articles) < articles_count and topic_index < len(topics):
-        topic_data = topics[topic_index]
-        topic = topic_data.get('keyword', topic_data.get('title', 'Unknown Topic'))
-        topic_index += 1
+    def _is_duplicate_topic(topic: str, batch_topics: set) -> bool:
+        """Check a candidate topic against existing keywords, titles and the current batch."""
+        topic_lower = topic.lower()
 
         # Skip if topic already used
-        if topic.lower() in used_topics:
+        if topic_lower in used_topics or topic_lower in batch_topics:
             logger.info(f"Skipping duplicate topic: {topic}")
-            continue
-
-        # Skip if very similar topic exists (word overlap similarity)
-        topic_lower = topic.lower()
-        is_duplicate = False
+            return True
 
         # 1. Compare new topic keyword against existing trending keywords
         for existing_kw in existing_keywords:
             if _is_similar(topic_lower, existing_kw, threshold=0.4):
                 logger.info(f"Skipping similar keyword (keyword match): '{topic}' ~ '{existing_kw}'")
-                is_duplicate = True
-                break
+                return True
 
         # 2. Compare against existing article titles
-        if not is_duplicate:
-            for existing_title in existing_titles:
-                if _is_similar(topic_lower, existing_title, threshold=0.35):
-                    logger.info(f"Skipping similar topic (title match): '{topic}' ~ '{existing_title}'")
-                    is_duplicate = True
-                    break
+        for existing_title in existing_titles:
+            if _is_similar(topic_lower, existing_title, threshold=0.35):
+                logger.info(f"Skipping similar topic (title match): '{topic}' ~ '{existing_title}'")
+                return True
 
         # 3. Also check against other topics in current batch
-        if not is_duplicate:
-            for used in used_topics:
-                if _is_similar(topic_lower, used, threshold=0.4):
-                    logger.info(f"Skipping similar topic in batch: '{topic}' ~ '{used}'")
-                    is_duplicate = True
-                    break
-
-        if is_duplicate:
-            continue
+        for used in used_topics | batch_topics:
+            if _is_similar(topic_lower, used, threshold=0.4):
+                logger.info(f"Skipping similar topic in batch: '{topic}' ~ '{used}'")
+                return True
 
-        logger.info(f"Generating article {len(articles)+1}/{articles_count}: {topic}")
+        return False
 
-        source_url = topic_data.get('url', '')
-        article = generate_article(
+    def _generate(topic_data: Dict) -> Dict:
+        topic = topic_data.get('keyword', topic_data.get('title', 'Unknown Topic'))
+        return generate_article(
             topic,
             existing_articles=existing_articles_for_links,
-            source_url=source_url,
+            source_url=topic_data.get('url', ''),
             **kwargs,
         )
 
-        if article and article.get('word_count', 0) >= 500:
-            # Post-generation semantic duplicate check
-            if existing_titles and _is_semantic_duplicate(article['title'], existing_titles):
-                logger.info(f"Skipping semantic duplicate: '{article['title']}'")
+    while generated_count < articles_count and topic_index < len(topics):
+        # Pick as many non-duplicate topics as articles are still needed
+        batch = []
+        batch_topics = set()
+        while len(batch) < articles_count - generated_count and topic_index < len(topics):
+            topic_data = topics[topic_index]
+            topic = topic_data.get('keyword', topic_data.get('title', 'Unknown Topic'))
+            topic_index += 1
+
+            if _is_duplicate_topic(topic, batch_topics):
                 continue
 
-            # Add source information
-            article['source_data'] = topic_data
-            articles.append(article)
-            used_topics.add(topic.lower())
-            existing_titles.add(article['title'].lower())
-        elif article:
-            logger.warning(f"Article too short ({article.get('word_count', 0)} words), skipping: {topic}")
-        else:
-            logger.warning(f"Failed to generate article for: {topic}")
+            batch.append((topic, topic_data))
+            batch_topics.add(topic.lower())
+
+        if not batch:
+            break
+
+        for i, (topic, _) in enumerate(batch, generated_count + 1):
+            logger.info(f"Generating article {i}/{articles_count}: {topic}")
+
+        # Generate the batch concurrently; results come back in topic order and
+        # each one is checked and yielded while the rest are still generating
+        with ThreadPoolExecutor(max_workers=max(1, min(len(batch), concurrency))) as executor:
+            generated = executor.map(_generate, [topic_data for _, topic_data in batch])
+
+            for (topic, topic_data), article in zip(batch, generated):
+                if article and article.get('word_count', 0) >= 500:
+                    # Post-generation semantic duplicate check
+                    if existing_titles and _is_semantic_duplicate(article['title'], existing_titles):
+                        logger.info(f"Skipping semantic duplicate: '{article['title']}'")
+                        continue
 
-    logger.info(f"Successfully generated {len(articles)} unique articles")
+                    # Add source information
+                    article['source_data'] = topic_data
+                    generated_count += 1
+                    used_topics.add(topic.lower())
+                    existing_titles.add(article['title'].lower())
+                    yield article
+                elif article:
+                    logger.warning(f"Article too short ({article.get('word_count', 0)} words), skipping: {topic}")
+                else:
+                    logger.warning(f"Failed to generate article for: {topic}")
 
-    return articles
+    logger.info(f"Successfully generated {generated_count} unique articles")
+
+
+def generate_multiple_articles(
+    topics: list,
+    articles_count: int = 3,
+    **kwargs
+) -> list:
+    """Generate multiple articles from a list of topics with duplicate checking."""
+    return list(iter_generated_articles(topics, articles_count, **kwargs))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,10 @@
+-- Migration: Add articles_missing_sources view for backfill_sources
+-- Run this in the Supabase SQL Editor
+
+-- Published articles with no trending source, resolved server-side so the
+-- backfill doesn't download every trending_sources row to diff locally
+CREATE OR REPLACE VIEW articles_missing_sources AS
+SELECT a.id, a.slug, a.title
+FROM articles a
+LEFT JOIN trending_sources ts ON a.id = ts.article_id
+WHERE a.published = true AND ts.article_id IS NULL;
@@ -0,0 +1,28 @@
+-- Migration: Add create_articles_with_sources() for single round-trip article saves
+-- Run this in the Supabase SQL Editor
+
+-- Insert articles (skipping existing slugs) and their trending sources in one
+-- transaction. Each payload element is an articles row plus an optional
+-- source_data object holding a trending_sources row.
+CREATE OR REPLACE FUNCTION create_articles_with_sources(payload JSONB)
+RETURNS SETOF articles
+LANGUAGE sql
+AS $$
+  WITH created AS (
+    INSERT INTO articles (slug, title, content, meta_description, keywords, reading_time,
+                          word_count, topic, published, featured_image, image_attribution, author)
+    SELECT r.slug, r.title, r.content, r.meta_description, r.keywords, r.reading_time,
+           r.word_count, r.topic, r.published, r.featured_image, r.image_attribution, r.author
+    FROM jsonb_populate_recordset(NULL::articles, payload) r
+    ON CONFLICT (slug) DO NOTHING
+    RETURNING *
+  ), sources AS (
+    INSERT INTO trending_sources (article_id, keyword, source, score, region, url, timestamp)
+    SELECT c.id, s.keyword, s.source, s.score, s.region, s.url, s.timestamp
+    FROM created c
+    JOIN jsonb_array_elements(payload) AS p(item) ON p.item->>'slug' = c.slug
+    CROSS JOIN LATERAL jsonb_populate_record(NULL::trending_sources, p.item->'source_data') s
+    WHERE p.item ? 'source_data'
+  )
+  SELECT * FROM created;
+$$;
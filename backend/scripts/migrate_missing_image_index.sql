@@ -0,0 +1,9 @@
+-- Migration: Partial index for articles without a cover image
+-- Run this in the Supabase SQL Editor
+--
+-- Matches list_articles_without_images' filter, so image backfills read a
+-- small index instead of scanning every article. (slug lookups are already
+-- served by the index behind the UNIQUE constraint on articles.slug.)
+
+CREATE INDEX IF NOT EXISTS idx_articles_missing_image ON articles(id)
+  WHERE published = true AND (featured_image IS NULL OR featured_image = '');
@@ -0,0 +1,16 @@
+-- Migration: Add prompt_cache table for reusing generated cover images
+-- Run this in the Supabase SQL Editor
+
+-- 1. Generated image URL keyed by a hash of the article's topic + title
+CREATE TABLE IF NOT EXISTS prompt_cache (
+  key TEXT PRIMARY KEY,
+  image_url TEXT NOT NULL,
+  created_at TIMESTAMPTZ DEFAULT now()
+);
+
+-- 2. Only the backend (service role) reads and writes the cache
+ALTER TABLE prompt_cache ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Service role prompt cache access"
+  ON prompt_cache FOR ALL
+  USING (auth.role() = 'service_role');
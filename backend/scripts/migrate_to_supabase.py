@@ -148,19 +148,17 @@ def migrate_article(article: Dict, db, dry_run: bool = False) -> bool:
         logger.error("Article missing slug")
         return False
 
-    # Check if already exists
-    if db.check_slug_exists(slug):
-        logger.warning(f"Article already exists: {slug}")
-        return False
-
     if dry_run:
+        if db.check_slug_exists(slug):
+            logger.warning(f"Article already exists: {slug}")
+            return False
         logger.info(f"[DRY RUN] Would migrate: {slug}")
         return True
 
     # Extract source data
     source_data = article.get('source_data', {})
 
-    # Create article in database
+    # Create article in database (existing slugs are skipped server-side)
     result = db.create_article(
         slug=slug,
         title=article.get('title', ''),
@@ -0,0 +1,20 @@
+-- Migration: Add update_article_images() for single round-trip image backfills
+-- Run this in the Supabase SQL Editor
+
+-- Set featured_image / image_attribution on existing articles only. Each
+-- payload element is {slug, featured_image, image_attribution}; slugs that
+-- no longer exist are skipped. Returns the number of articles updated.
+CREATE OR REPLACE FUNCTION update_article_images(payload JSONB)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+  WITH updated AS (
+    UPDATE articles a
+    SET featured_image = r.featured_image,
+        image_attribution = r.image_attribution
+    FROM jsonb_to_recordset(payload) AS r(slug TEXT, featured_image TEXT, image_attribution JSONB)
+    WHERE a.slug = r.slug
+    RETURNING 1
+  )
+  SELECT count(*)::INTEGER FROM updated;
+$$;
@@ -0,0 +1,19 @@
+-- Migration: Add update_article_keywords() for single round-trip keyword backfills
+-- Run this in the Supabase SQL Editor
+
+-- Set keywords on existing articles only. Each payload element is
+-- {id, keywords}; ids that no longer exist are skipped. Returns the number
+-- of articles updated.
+CREATE OR REPLACE FUNCTION update_article_keywords(payload JSONB)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+  WITH updated AS (
+    UPDATE articles a
+    SET keywords = r.keywords
+    FROM jsonb_to_recordset(payload) AS r(id UUID, keywords TEXT[])
+    WHERE a.id = r.id
+    RETURNING 1
+  )
+  SELECT count(*)::INTEGER FROM updated;
+$$;
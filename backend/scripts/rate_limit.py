@@ -0,0 +1,38 @@
+"""
+Rate Limiter
+
+Thread-safe token bucket used to pace calls to external APIs
+(Gemini, Unsplash) when they are issued from worker threads.
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` calls per `per` seconds, with bursts up to `burst`."""
+
+    def __init__(self, rate: float, per: float = 60.0, burst: int = 1):
+        self.capacity = max(1, burst)
+        self.fill_rate = rate / per  # tokens per second
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.fill_rate
+            time.sleep(wait)
+
+    def sync(self, remaining: float) -> None:
+        """Lower the bucket to a provider-reported remaining quota; never raises it."""
+        with self._lock:
+            self.tokens = min(self.tokens, max(0.0, remaining))
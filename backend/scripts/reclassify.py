@@ -8,7 +8,6 @@ Classifies articles into predefined categories using:
 import os
 import logging
 import subprocess
-import shutil
 from typing import Dict, List
 
 from dotenv import load_dotenv
@@ -19,6 +18,8 @@ try:
 except ImportError:
     genai = None
 
+from scripts.generate_content import GEMINI_CLI_PATH
+
 logger = logging.getLogger(__name__)
 
 VALID_CATEGORIES = [
@@ -26,7 +27,26 @@ VALID_CATEGORIES = [
     'KOREA', 'POLICY', 'SCIENCE', 'SECURITY', 'SPACE', 'TECH',
 ]
 
-_gemini_cli_path = shutil.which('gemini')
+# Fixed instruction sent once as the model's system instruction
+_CLASSIFY_INSTRUCTION = (
+    f"Classify this article into exactly ONE category from this list: "
+    f"{VALID_CATEGORIES}\n"
+    f"Reply with ONLY the category name, nothing else."
+)
+
+_classifier_model = None
+
+
+def _get_classifier_model():
+    """Lazily create the Gemini classifier model, shared by every classify call."""
+    global _classifier_model
+    if _classifier_model is None:
+        genai.configure(api_key=os.getenv('GOOGLE_API_KEY'))
+        _classifier_model = genai.GenerativeModel(
+            'gemini-3-flash-preview',
+            system_instruction=_CLASSIFY_INSTRUCTION,
+        )
+    return _classifier_model
 
 
 def _parse_category(text: str, fallback: str) -> str:
@@ -48,20 +68,15 @@ def classify_article(article: Dict) -> str:
     content = article.get('content', '')[:1000]
     fallback = article.get('topic', 'TECH')
 
-    prompt = (
-        f"Classify this article into exactly ONE category from this list: "
-        f"{VALID_CATEGORIES}\n\n"
+    article_text = (
         f"Title: {title}\n"
-        f"Content preview: {content}\n\n"
-        f"Reply with ONLY the category name, nothing else."
+        f"Content preview: {content}"
     )
 
     # Try Gemini API (fast)
     if os.getenv('GOOGLE_API_KEY') and genai:
         try:
-            genai.configure(api_key=os.getenv('GOOGLE_API_KEY'))
-            model = genai.GenerativeModel('gemini-3-flash-preview')
-            resp = model.generate_content(prompt)
+            resp = _get_classifier_model().generate_content(article_text)
             result = _parse_category(resp.text, fallback)
             if result != fallback:
                 return result
@@ -70,10 +85,11 @@ def classify_article(article: Dict) -> str:
             logger.warning(f"Gemini API classification failed: {e}")
 
     # Fallback to Gemini CLI
-    if _gemini_cli_path:
+    if GEMINI_CLI_PATH:
+        prompt = f"{_CLASSIFY_INSTRUCTION}\n\n{article_text}"
         try:
             result = subprocess.run(
-                [_gemini_cli_path, '-m', 'gemini-2.5-flash', '-p', prompt],
+                [GEMINI_CLI_PATH, '-m', 'gemini-2.5-flash', '-p', prompt],
                 capture_output=True, text=True, timeout=30,
             )
             if result.returncode == 0:
@@ -86,20 +102,23 @@ def classify_article(article: Dict) -> str:
     return fallback
 
 
-def classify_articles(articles: List[Dict]) -> List[Dict]:
-    """Verify and correct categories for a list of articles (in-memory)."""
-    corrected = 0
+def verify_article_category(article: Dict) -> bool:
+    """Verify one article's category, correcting it in place. Returns True if it changed."""
+    old_cat = article.get('topic', 'TECH')
+    new_cat = classify_article(article)
 
-    for i, article in enumerate(articles):
-        old_cat = article.get('topic', 'TECH')
-        new_cat = classify_article(article)
+    if new_cat != old_cat:
+        logger.info(f"Category corrected: '{old_cat}' -> '{new_cat}' for '{article['title']}'")
+        article['topic'] = new_cat
+        return True
+
+    logger.info(f"Category confirmed: '{new_cat}' for '{article['title']}'")
+    return False
 
-        if new_cat != old_cat:
-            logger.info(f"Category corrected: '{old_cat}' -> '{new_cat}' for '{article['title']}'")
-            article['topic'] = new_cat
-            corrected += 1
-        else:
-            logger.info(f"Category confirmed: '{new_cat}' for '{article['title']}'")
+
+def classify_articles(articles: List[Dict]) -> List[Dict]:
+    """Verify and correct categories for a list of articles (in-memory)."""
+    corrected = sum(1 for article in articles if verify_article_category(article))
 
     logger.info(f"Classification done: {corrected}/{len(articles)} corrected")
     return articles
@@ -9,12 +9,17 @@ import logging
 import os
 import json
 import re
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime
 from pathlib import Path
 
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import database client
 try:
     from scripts.database import get_db_client, is_supabase_enabled
@@ -59,6 +64,33 @@ def create_slug(title: str) -> str:
     return slug
 
 
+def _database_fields(article: Dict) -> Dict:
+    """Map a generated article to DatabaseClient.create_article keyword arguments."""
+    # Prepare source data
+    source_data = article.get('source_data', {})
+    if source_data and not isinstance(source_data, dict):
+        source_data = {}
+
+    return {
+        'slug': create_slug(article['title']),
+        'title': article['title'],
+        'content': article['content'],
+        'meta_description': article.get('meta_description', ''),
+        'keywords': article.get('keywords', []),
+        'reading_time': article.get('reading_time', 5),
+        'word_count': article.get('word_count', 0),
+        'topic': article.get('topic', ''),
+        'published': True,
+        'featured_image': article.get('featured_image', ''),
+        'image_attribution': article.get('image_attribution', {}),
+        'author': {
+            'name': 'NexusTopic Editorial Team',
+            'bio': 'Delivering the latest trending topics and insights'
+        },
+        'source_data': source_data if source_data else None,
+    }
+
+
 def save_article_to_database(article: Dict) -> bool:
     """
     Save article to Supabase database.
@@ -79,41 +111,15 @@ def save_article_to_database(article: Dict) -> bool:
         # Create slug
         slug = create_slug(article['title'])
 
-        # Check if article already exists
-        if db.check_slug_exists(slug):
-            logger.warning(f"Article with slug '{slug}' already exists in database")
-            return False
-
-        # Prepare source data
-        source_data = article.get('source_data', {})
-        if source_data and not isinstance(source_data, dict):
-            source_data = {}
-
-        # Create article in database
-        result = db.create_article(
-            slug=slug,
-            title=article['title'],
-            content=article['content'],
-            meta_description=article.get('meta_description', ''),
-            keywords=article.get('keywords', []),
-            reading_time=article.get('reading_time', 5),
-            word_count=article.get('word_count', 0),
-            topic=article.get('topic', ''),
-            published=True,
-            featured_image=article.get('featured_image', ''),
-            image_attribution=article.get('image_attribution', {}),
-            author={
-                'name': 'NexusTopic Editorial Team',
-                'bio': 'Delivering the latest trending topics and insights'
-            },
-            source_data=source_data if source_data else None
-        )
+        # Insert with ON CONFLICT (slug) DO NOTHING: an existing slug simply
+        # yields no row, so no separate existence check is needed
+        result = db.create_article(**_database_fields(article))
 
         if result:
             logger.info(f"Article saved to database: {slug}")
             return True
         else:
-            logger.error(f"Failed to save article to database: {slug}")
+            logger.warning(f"Article '{slug}' not saved to database (slug exists or insert failed)")
             return False
 
     except Exception as e:
@@ -121,6 +127,86 @@ def save_article_to_database(article: Dict) -> bool:
         return False
 
 
+def save_articles_to_database(articles: List[Dict]) -> set:
+    """
+    Save several articles to Supabase in a single bulk insert.
+    Articles whose slug already exists are skipped.
+
+    Args:
+        articles: Article dictionaries from generate_content
+
+    Returns:
+        Set of slugs that were saved
+    """
+    if not articles or not SUPABASE_AVAILABLE or not is_supabase_enabled():
+        return set()
+
+    try:
+        db = get_db_client()
+        created = db.create_articles([_database_fields(a) for a in articles])
+        saved = {a['slug'] for a in created}
+
+        for article in articles:
+            slug = create_slug(article['title'])
+            if slug in saved:
+                logger.info(f"Article saved to database: {slug}")
+            else:
+                logger.warning(f"Article '{slug}' not saved to database (slug exists or insert failed)")
+
+        return saved
+
+    except Exception as e:
+        logger.error(f"Error saving articles to database: {str(e)}")
+        return set()
+
+
+def _dump_json(data, file_path: Path) -> None:
+    """Write pretty-printed UTF-8 JSON, using orjson when it is installed."""
+    if orjson:
+        file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def _write_article_json(article: Dict, output_dir: str) -> str:
+    """Write one article to <output_dir>/<slug>.json and return the path."""
+    # Create output directory if it doesn't exist
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    # Create slug from title
+    slug = create_slug(article['title'])
+
+    # Add metadata
+    article_data = {
+        'slug': slug,
+        'title': article['title'],
+        'meta_description': article.get('meta_description', ''),
+        'content': article['content'],
+        'keywords': article.get('keywords', []),
+        'reading_time': article.get('reading_time', 5),
+        'word_count': article.get('word_count', 0),
+        'topic': article.get('topic', ''),
+        'created_at': article.get('timestamp', datetime.now().isoformat()),
+        'updated_at': datetime.now().isoformat(),
+        'published': True,
+        'featured_image': article.get('featured_image', ''),
+        'image_attribution': article.get('image_attribution', {}),
+        'source_data': article.get('source_data', {})
+    }
+
+    # Save to JSON file
+    file_path = output_path / f"{slug}.json"
+
+    _dump_json(article_data, file_path)
+
+    logger.info(f"Article saved to JSON: {file_path}")
+
+    return str(file_path)
+
+
 def save_article(
     article: Dict,
     output_dir: str = '../frontend/public/articles'
@@ -151,40 +237,7 @@ def save_article(
         keep_json_backup = os.getenv('KEEP_JSON_BACKUP', 'true').lower() == 'true'
 
         if keep_json_backup or not db_saved:
-            # Create output directory if it doesn't exist
-            output_path = Path(output_dir)
-            output_path.mkdir(parents=True, exist_ok=True)
-
-            # Create slug from title
-            slug = create_slug(article['title'])
-
-            # Add metadata
-            article_data = {
-                'slug': slug,
-                'title': article['title'],
-                'meta_description': article.get('meta_description', ''),
-                'content': article['content'],
-                'keywords': article.get('keywords', []),
-                'reading_time': article.get('reading_time', 5),
-                'word_count': article.get('word_count', 0),
-                'topic': article.get('topic', ''),
-                'created_at': article.get('timestamp', datetime.now().isoformat()),
-                'updated_at': datetime.now().isoformat(),
-                'published': True,
-                'featured_image': article.get('featured_image', ''),
-                'image_attribution': article.get('image_attribution', {}),
-                'source_data': article.get('source_data', {})
-            }
-
-            # Save to JSON file
-            file_path = output_path / f"{slug}.json"
-
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(article_data, f, ensure_ascii=False, indent=2)
-
-            logger.info(f"Article saved to JSON: {file_path}")
-
-            return str(file_path)
+            return _write_article_json(article, output_dir)
         else:
             logger.info("JSON backup disabled, article saved only to database")
             return "database_only"
@@ -244,8 +297,7 @@ def save_articles_index(
         combined_index.sort(key=lambda x: x['created_at'], reverse=True)
 
         # Save index
-        with open(index_path, 'w', encoding='utf-8') as f:
-            json.dump(combined_index, f, ensure_ascii=False, indent=2)
+        _dump_json(combined_index, index_path)
 
         logger.info(f"Articles index updated: {index_path}")
         logger.info(f"Total articles: {len(combined_index)}")
@@ -257,40 +309,88 @@ def save_articles_index(
         return False
 
 
+# Articles buffered per bulk database insert in save_multiple_articles
+DB_BATCH_SIZE = 20
+
+# Article fields needed for the listing index (everything except the body)
+_INDEX_FIELDS = ('title', 'meta_description', 'reading_time', 'keywords', 'timestamp', 'topic')
+
+
 def save_multiple_articles(
-    articles: List[Dict],
+    articles: Iterable[Dict],
     output_dir: str = '../frontend/public/articles'
 ) -> List[Dict]:
     """
     Save multiple articles and update index.
 
+    Articles are consumed one at a time, so a generator can be passed.
+    Database writes are buffered and flushed as bulk inserts of up to
+    DB_BATCH_SIZE articles.
+
     Args:
-        articles: List of article dictionaries
+        articles: Iterable of article dictionaries
         output_dir: Directory to save articles
 
     Returns:
         List of results with paths and statuses
     """
     results = []
+    index_entries = []
+    pending = []  # (article, result) awaiting the next bulk database insert
+
+    use_database = SUPABASE_AVAILABLE and is_supabase_enabled()
+    keep_json_backup = os.getenv('KEEP_JSON_BACKUP', 'true').lower() == 'true'
+
+    def flush() -> None:
+        saved = save_articles_to_database([article for article, _ in pending])
+        for article, result in pending:
+            if result['slug'] in saved:
+                if result['path'] is None:
+                    logger.info("JSON backup disabled, article saved only to database")
+                    result['path'] = "database_only"
+            elif result['path'] is None:
+                logger.warning("Database save failed, will save to JSON")
+                try:
+                    result['path'] = _write_article_json(article, output_dir)
+                except Exception as e:
+                    logger.error(f"Error saving article: {str(e)}")
+            result['success'] = result['path'] is not None
+        pending.clear()
 
     for i, article in enumerate(articles):
-        logger.info(f"Saving article {i+1}/{len(articles)}: {article['title']}")
-
-        file_path = save_article(article, output_dir)
+        logger.info(f"Saving article {i+1}: {article['title']}")
 
-        results.append({
+        result = {
             'title': article['title'],
             'slug': create_slug(article['title']),
-            'path': file_path,
-            'success': file_path is not None,
+            'path': None,
+            'success': False,
             'timestamp': datetime.now().isoformat()
-        })
+        }
+        results.append(result)
+        index_entries.append({k: article[k] for k in _INDEX_FIELDS if k in article})
+
+        # Save to JSON now if it's kept as a backup or the database is off
+        if keep_json_backup or not use_database:
+            try:
+                result['path'] = _write_article_json(article, output_dir)
+            except Exception as e:
+                logger.error(f"Error saving article: {str(e)}")
+            result['success'] = result['path'] is not None
+
+        if use_database:
+            pending.append((article, result))
+            if len(pending) >= DB_BATCH_SIZE:
+                flush()
+
+    if pending:
+        flush()
 
     # Update index
-    save_articles_index(articles, output_dir)
+    save_articles_index(index_entries, output_dir)
 
     success_count = sum(1 for r in results if r['success'])
-    logger.info(f"Saved {success_count}/{len(articles)} articles successfully")
+    logger.info(f"Saved {success_count}/{len(results)} articles successfully")
 
     # Trigger Next.js on-demand revalidation
     if success_count > 0:
@@ -47,12 +47,22 @@ CREATE TABLE article_analytics (
   UNIQUE(article_id, date)
 );
 
+-- Generated cover image cache (keyed by hash of topic + title)
+CREATE TABLE prompt_cache (
+  key TEXT PRIMARY KEY,
+  image_url TEXT NOT NULL,
+  created_at TIMESTAMPTZ DEFAULT now()
+);
+
 -- Indexes for performance
 CREATE INDEX idx_articles_slug ON articles(slug);
 CREATE INDEX idx_articles_published_created_at ON articles(published, created_at DESC);
 CREATE INDEX idx_articles_search_vector ON articles USING GIN(search_vector);
 CREATE INDEX idx_articles_keywords ON articles USING GIN(keywords);
 CREATE INDEX idx_trending_sources_article_id ON trending_sources(article_id);
+-- Partial index: only articles still waiting for a cover image
+CREATE INDEX idx_articles_missing_image ON articles(id)
+  WHERE published = true AND (featured_image IS NULL OR featured_image = '');
 
 -- Auto-update updated_at trigger
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -90,9 +100,78 @@ FROM articles a
 LEFT JOIN trending_sources ts ON a.id = ts.article_id
 WHERE a.published = true;
 
+-- Published articles with no trending source (anti-join for backfill_sources)
+CREATE VIEW articles_missing_sources AS
+SELECT a.id, a.slug, a.title
+FROM articles a
+LEFT JOIN trending_sources ts ON a.id = ts.article_id
+WHERE a.published = true AND ts.article_id IS NULL;
+
+-- Insert articles (skipping existing slugs) and their trending sources in one
+-- transaction. Each payload element is an articles row plus an optional
+-- source_data object holding a trending_sources row.
+CREATE OR REPLACE FUNCTION create_articles_with_sources(payload JSONB)
+RETURNS SETOF articles
+LANGUAGE sql
+AS $$
+  WITH created AS (
+    INSERT INTO articles (slug, title, content, meta_description, keywords, reading_time,
+                          word_count, topic, published, featured_image, image_attribution, author)
+    SELECT r.slug, r.title, r.content, r.meta_description, r.keywords, r.reading_time,
+           r.word_count, r.topic, r.published, r.featured_image, r.image_attribution, r.author
+    FROM jsonb_populate_recordset(NULL::articles, payload) r
+    ON CONFLICT (slug) DO NOTHING
+    RETURNING *
+  ), sources AS (
+    INSERT INTO trending_sources (article_id, keyword, source, score, region, url, timestamp)
+    SELECT c.id, s.keyword, s.source, s.score, s.region, s.url, s.timestamp
+    FROM created c
+    JOIN jsonb_array_elements(payload) AS p(item) ON p.item->>'slug' = c.slug
+    CROSS JOIN LATERAL jsonb_populate_record(NULL::trending_sources, p.item->'source_data') s
+    WHERE p.item ? 'source_data'
+  )
+  SELECT * FROM created;
+$$;
+
+-- Set featured_image / image_attribution on existing articles only. Each
+-- payload element is {slug, featured_image, image_attribution}; slugs that
+-- no longer exist are skipped. Returns the number of articles updated.
+CREATE OR REPLACE FUNCTION update_article_images(payload JSONB)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+  WITH updated AS (
+    UPDATE articles a
+    SET featured_image = r.featured_image,
+        image_attribution = r.image_attribution
+    FROM jsonb_to_recordset(payload) AS r(slug TEXT, featured_image TEXT, image_attribution JSONB)
+    WHERE a.slug = r.slug
+    RETURNING 1
+  )
+  SELECT count(*)::INTEGER FROM updated;
+$$;
+
+-- Set keywords on existing articles only. Each payload element is
+-- {id, keywords}; ids that no longer exist are skipped. Returns the number
+-- of articles updated.
+CREATE OR REPLACE FUNCTION update_article_keywords(payload JSONB)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+  WITH updated AS (
+    UPDATE articles a
+    SET keywords = r.keywords
+    FROM jsonb_to_recordset(payload) AS r(id UUID, keywords TEXT[])
+    WHERE a.id = r.id
+    RETURNING 1
+  )
+  SELECT count(*)::INTEGER FROM updated;
+$$;
+
 -- Row Level Security
 ALTER TABLE articles ENABLE ROW LEVEL SECURITY;
 ALTER TABLE trending_sources ENABLE ROW LEVEL SECURITY;
+ALTER TABLE prompt_cache ENABLE ROW LEVEL SECURITY;
 
 CREATE POLICY "Public read published articles"
   ON articles FOR SELECT
@@ -113,3 +192,7 @@ CREATE POLICY "Public read sources"
 CREATE POLICY "Service role sources access"
   ON trending_sources FOR ALL
   USING (auth.role() = 'service_role');
+
+CREATE POLICY "Service role prompt cache access"
+  ON prompt_cache FOR ALL
+  USING (auth.role() = 'service_role');